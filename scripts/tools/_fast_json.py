@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Fast JSON helpers shared by the RalphOS tools.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Both helpers work on bytes, so callers can read and write files
+in binary mode and skip the text decode/encode step.
+
+Usage:
+    from _fast_json import dump_indented, dumps, dumps_line, loads
+
+    with open(path, "rb") as f:
+        data = loads(f.read())
+    with open(path, "wb") as f:
+        f.write(dumps(data))
+    with open(jsonl_path, "ab") as f:
+        f.write(dumps_line(record))
+    with open(report_path, "wb") as f:
+        dump_indented(report, f)
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to json
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError subclasses this
+
+if orjson:
+    dumps = orjson.dumps
+    loads = orjson.loads
+
+    def dumps_line(obj) -> bytes:
+        """Serialize obj to one newline-terminated JSONL record."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    def dump_indented(obj, fp, default=None):
+        """Write obj to binary file fp as 2-space indented JSON, newline-terminated."""
+        fp.write(orjson.dumps(
+            obj,
+            default=default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        ))
+else:
+    def dumps(obj) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def dumps_line(obj) -> bytes:
+        """Serialize obj to one newline-terminated JSONL record."""
+        return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
+
+    def dump_indented(obj, fp, default=None):
+        """Write obj to binary file fp as 2-space indented JSON, newline-terminated."""
+        # Encoded chunk by chunk, so the whole document is never held as one str
+        for chunk in json.JSONEncoder(indent=2, ensure_ascii=False, default=default).iterencode(obj):
+            fp.write(chunk.encode())
+        fp.write(b"\n")
+
+    loads = json.loads
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Streaming sample helpers shared by the RalphOS audit tools.
+
+Usage:
+    from _sampling import reservoir_sample
+
+    total, sample = reservoir_sample(iter_paths(), 100)
+"""
+
+import math
+import random
+from itertools import islice
+from typing import Iterable
+
+
+def reservoir_sample(items: Iterable, k: int) -> tuple[int, list]:
+    """
+    Uniformly sample k items from an iterable of unknown length.
+
+    Uses Algorithm L: after the reservoir fills, it jumps over geometrically
+    distributed runs of items instead of drawing a random number per item.
+    Returns (total item count, sample); the sample is everything if there
+    were k items or fewer.
+    """
+    it = iter(items)
+    reservoir = list(islice(it, k))
+    total = len(reservoir)
+    if total < k or k <= 0:
+        return total + sum(1 for _ in it), reservoir
+
+    w = math.exp(math.log(random.random()) / k)
+    while True:
+        skip = math.floor(math.log(random.random()) / math.log(1 - w))
+        skipped = sum(1 for _ in islice(it, skip))
+        total += skipped
+        item = next(it, None) if skipped == skip else None
+        if item is None:
+            return total, reservoir
+        total += 1
+        reservoir[random.randrange(k)] = item
+        w *= math.exp(math.log(random.random()) / k)
@@ -20,632 +20,893 @@ Requirements:
 
 import argparse
 import asyncio
+import gzip
 import hashlib
+import importlib.util
+import io
 import json
 import logging
 import os
 import random
+import re
 import signal
+import sqlite3
 import sys
+import tarfile
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-try:
- import orjson
-except ImportError:
- orjson = None
+from _fast_json import dumps, dumps_line, loads
 
-try:
- from camoufox.async_api import AsyncCamoufox
- CAMOUFOX_AVAILABLE = True
-except ImportError:
- CAMOUFOX_AVAILABLE = False
- print("WARNING: camoufox not installed. Run: pip install camoufox[geoip]")
+# camoufox pulls in Playwright, so it is only imported once a browser is needed
+CAMOUFOX_AVAILABLE = importlib.util.find_spec("camoufox") is not None
+if not CAMOUFOX_AVAILABLE:
+    print("WARNING: camoufox not installed. Run: pip install camoufox[geoip]")
 
 try:
- from tqdm.asyncio import tqdm as async_tqdm
- TQDM_AVAILABLE = True
+    from tqdm.asyncio import tqdm as async_tqdm
+    TQDM_AVAILABLE = True
 except ImportError:
- TQDM_AVAILABLE = False
+    TQDM_AVAILABLE = False
 
 try:
- from dotenv import load_dotenv
- load_dotenv()
+    from dotenv import load_dotenv
+    load_dotenv()
 except ImportError:
- pass
+    pass
 
 # Setup logging
 logging.basicConfig(
- level=logging.INFO,
- format="%(asctime)s - %(levelname)s - %(message)s",
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# Fingerprint choices, randomized per browser launch / request
+BROWSER_OS_CHOICES = ("windows", "macos", "linux")
+LOCALES = ("en-US", "en-GB", "en-CA", "en-AU")
+REFERRERS = (
+    "https://www.google.com/",
+    "https://www.google.co.uk/",
+    "https://www.bing.com/",
+    "https://duckduckgo.com/",
+    "",  # No referrer sometimes
+)
+
+# Number of pre-warmed browser contexts rotated round-robin
+CONTEXT_POOL_SIZE = 3
+
+# Block/rate-limit markers, matched case-insensitively in one pass over the page bytes
+BLOCK_MARKERS_RE = re.compile(
+    rb"(?P<challenge>challenge)|(?P<cloudflare>cloudflare)|(?P<rate_limit>too many requests|rate limit)",
+    re.IGNORECASE,
+)
+
+# Checkpoint updates are committed (and the JSON status rewritten) every N marks
+CHECKPOINT_SAVE_EVERY = 10
+
 # Shutdown handling
 shutdown_event = asyncio.Event()
 
 def signal_handler(signum, frame):
- if shutdown_event.is_set():
- sys.exit(1)
- logger.info("\nGraceful shutdown requested... (Ctrl+C again to force)")
- shutdown_event.set()
+    if shutdown_event.is_set():
+        sys.exit(1)
+    logger.info("\nGraceful shutdown requested... (Ctrl+C again to force)")
+    shutdown_event.set()
 
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 
 class AggressiveStealthConfig:
- """Configuration for aggressive stealth scraping."""
- 
- def __init__(
- self,
- output_dir: Path,
- # Much longer delays for protected sites
- min_delay: float = 8.0,
- max_delay: float = 20.0,
- # Initial backoff time in seconds (5 minutes)
- initial_backoff: int = 300,
- # Maximum backoff time (30 minutes)
- max_backoff: int = 1800,
- # Rotate session more frequently
- rotate_every: int = 12,
- # Daily limit to avoid detection patterns
- daily_limit: Optional[int] = None,
- # Timeout per page
- timeout: int = 60000,
- headless: bool = True,
- # Proxy settings
- proxy_host: Optional[str] = None,
- proxy_port: Optional[int] = None,
- proxy_user: Optional[str] = None,
- proxy_pass: Optional[str] = None,
- ):
- self.output_dir = Path(output_dir)
- self.min_delay = min_delay
- self.max_delay = max_delay
- self.initial_backoff = initial_backoff
- self.max_backoff = max_backoff
- self.rotate_every = rotate_every
- self.daily_limit = daily_limit
- self.timeout = timeout
- self.headless = headless
- 
- # Proxy from args or env
- self.proxy_host = proxy_host or os.environ.get("BRIGHTDATA_PROXY_HOST", "brd.superproxy.io")
- self.proxy_port = proxy_port or int(os.environ.get("BRIGHTDATA_PROXY_PORT", "33335"))
- self.proxy_user = proxy_user or os.environ.get("BRIGHTDATA_PROXY_USER", "")
- self.proxy_pass = proxy_pass or os.environ.get("BRIGHTDATA_PROXY_PASS", "")
- 
- @property
- def proxy_dict(self) -> Optional[Dict[str, str]]:
- """Get Playwright-compatible proxy config if credentials available."""
- if not self.proxy_user or not self.proxy_pass:
- return None
- return {
- "server": f"http://{self.proxy_host}:{self.proxy_port}",
- "username": self.proxy_user,
- "password": self.proxy_pass,
- }
+    """Configuration for aggressive stealth scraping."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        # Much longer delays for protected sites
+        min_delay: float = 8.0,
+        max_delay: float = 20.0,
+        # Initial backoff time in seconds (5 minutes)
+        initial_backoff: int = 300,
+        # Maximum backoff time (30 minutes)
+        max_backoff: int = 1800,
+        # Rotate session more frequently
+        rotate_every: int = 12,
+        # Daily limit to avoid detection patterns
+        daily_limit: Optional[int] = None,
+        # Timeout per page
+        timeout: int = 60000,
+        headless: bool = True,
+        # Store HTML as {build_id}.html.gz
+        compress_html: bool = False,
+        # Pack HTML into tar shards of this many pages (0 = one file per page)
+        shard_size: int = 0,
+        # Proxy settings
+        proxy_host: Optional[str] = None,
+        proxy_port: Optional[int] = None,
+        proxy_user: Optional[str] = None,
+        proxy_pass: Optional[str] = None,
+    ):
+        self.output_dir = Path(output_dir)
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.rotate_every = rotate_every
+        self.daily_limit = daily_limit
+        self.timeout = timeout
+        self.headless = headless
+        self.compress_html = compress_html
+        self.shard_size = shard_size
+
+        # Proxy from args or env
+        self.proxy_host = proxy_host or os.environ.get("BRIGHTDATA_PROXY_HOST", "brd.superproxy.io")
+        self.proxy_port = proxy_port or int(os.environ.get("BRIGHTDATA_PROXY_PORT", "33335"))
+        self.proxy_user = proxy_user or os.environ.get("BRIGHTDATA_PROXY_USER", "")
+        self.proxy_pass = proxy_pass or os.environ.get("BRIGHTDATA_PROXY_PASS", "")
+
+    @property
+    def proxy_dict(self) -> Optional[Dict[str, str]]:
+        """Get Playwright-compatible proxy config if credentials available."""
+        if not self.proxy_user or not self.proxy_pass:
+            return None
+        return {
+            "server": f"http://{self.proxy_host}:{self.proxy_port}",
+            "username": self.proxy_user,
+            "password": self.proxy_pass,
+        }
 
 
 class SmartCheckpointManager:
- """Track processed URLs with daily limits and rate limit detection."""
- 
- def __init__(self, checkpoint_path: Path):
- self.path = checkpoint_path
- self.state = self._load()
- 
- def _load(self) -> Dict[str, Any]:
- if self.path.exists():
- try:
- with open(self.path, "rb") as f:
- if orjson:
- return orjson.loads(f.read())
- else:
- return json.load(f)
- except Exception as e:
- logger.warning(f"Error loading checkpoint: {e}")
- return {
- "processed_urls": [],
- "failed_urls": [],
- "blocked_urls": [],
- "rate_limited_count": 0,
- "consecutive_blocks": 0,
- "last_block_time": None,
- "current_backoff": 0,
- "daily_counts": {}, # {"2026-01-16": 50}
- "last_updated": None,
- }
- 
- def save(self):
- self.path.parent.mkdir(parents=True, exist_ok=True)
- self.state["last_updated"] = datetime.now().isoformat()
- with open(self.path, "wb") as f:
- if orjson:
- f.write(orjson.dumps(self.state, option=orjson.OPT_INDENT_2))
- else:
- f.write(json.dumps(self.state, indent=2).encode())
- 
- def is_processed(self, url: str) -> bool:
- return url in self.state["processed_urls"]
- 
- def mark_processed(self, url: str):
- if url not in self.state["processed_urls"]:
- self.state["processed_urls"].append(url)
- # Reset consecutive blocks on success
- self.state["consecutive_blocks"] = 0
- # Track daily count
- today = datetime.now().strftime("%Y-%m-%d")
- self.state["daily_counts"][today] = self.state["daily_counts"].get(today, 0) + 1
- 
- def mark_failed(self, url: str):
- if url not in self.state["failed_urls"]:
- self.state["failed_urls"].append(url)
- 
- def mark_blocked(self, url: str, backoff: int):
- if url not in self.state["blocked_urls"]:
- self.state["blocked_urls"].append(url)
- self.state["rate_limited_count"] += 1
- self.state["consecutive_blocks"] += 1
- self.state["last_block_time"] = datetime.now().isoformat()
- self.state["current_backoff"] = backoff
- 
- def get_today_count(self) -> int:
- today = datetime.now().strftime("%Y-%m-%d")
- return self.state["daily_counts"].get(today, 0)
- 
- def should_stop_for_day(self, daily_limit: Optional[int]) -> bool:
- if daily_limit is None:
- return False
- return self.get_today_count() >= daily_limit
- 
- def reset(self):
- self.state = {
- "processed_urls": [],
- "failed_urls": [],
- "blocked_urls": [],
- "rate_limited_count": 0,
- "consecutive_blocks": 0,
- "last_block_time": None,
- "current_backoff": 0,
- "daily_counts": {},
- "last_updated": None,
- }
- self.save()
- 
- @property
- def stats(self) -> Dict[str, int]:
- return {
- "processed": len(self.state["processed_urls"]),
- "failed": len(self.state["failed_urls"]),
- "blocked": len(self.state["blocked_urls"]),
- "rate_limited_total": self.state["rate_limited_count"],
- "consecutive_blocks": self.state["consecutive_blocks"],
- "today_count": self.get_today_count(),
- }
+    """
+    Track processed URLs with daily limits and rate limit detection.
+
+    State lives in a SQLite database (WAL mode) next to the checkpoint path.
+    mark_* calls are committed every CHECKPOINT_SAVE_EVERY updates and on
+    save(), which also writes a small JSON status summary to checkpoint_path
+    for the dashboard. A legacy JSON checkpoint (and its journal) is imported
+    into a temporary database that only replaces the real one once the import
+    has committed, so a failed import is retried on the next start.
+    """
+
+    def __init__(self, checkpoint_path: Path):
+        self.path = checkpoint_path
+        self.db_path = checkpoint_path.with_suffix(".db")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._pending = 0
+        self._today_str = ""
+        self._today_expiry = 0.0
+        self.counters = {
+            "rate_limited_count": 0,
+            "consecutive_blocks": 0,
+            "last_block_time": None,
+            "current_backoff": 0,
+        }
+        if self.db_path.exists():
+            self._open(self.db_path)
+            self.counters.update(self.db.execute("SELECT name, value FROM counters"))
+            return
+
+        # Build the new database (and import any legacy state) under a temporary name
+        tmp_path = self.db_path.with_name(self.db_path.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+        self._open(tmp_path)
+        imported = self._import_legacy()
+        self._commit()
+        self.db.close()
+        os.replace(tmp_path, self.db_path)
+        self._open(self.db_path)
+        if imported:
+            self.save()
+            self.path.with_suffix(".jsonl").unlink(missing_ok=True)
+            logger.info(f"Imported legacy checkpoint into {self.db_path}")
+
+    def _open(self, db_path: Path):
+        self.db = sqlite3.connect(db_path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS processed(url TEXT PRIMARY KEY, ts INTEGER);
+            CREATE TABLE IF NOT EXISTS failed(url TEXT PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS blocked(url TEXT PRIMARY KEY, ts INTEGER);
+            CREATE TABLE IF NOT EXISTS daily_counts(day TEXT PRIMARY KEY, count INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS counters(name TEXT PRIMARY KEY, value);
+        """)
+
+    def _import_legacy(self) -> bool:
+        """Import a pre-SQLite JSON checkpoint and replay its journal; True if there was one."""
+        journal_path = self.path.with_suffix(".jsonl")
+        state = None
+        if self.path.exists():
+            try:
+                with open(self.path, "rb") as f:
+                    state = loads(f.read())
+            except Exception as e:
+                logger.warning(f"Error loading checkpoint: {e}")
+        if not isinstance(state, dict) or "processed_urls" not in state:
+            return False
+
+        now = int(time.time())
+        self.db.executemany("INSERT OR IGNORE INTO processed VALUES (?, ?)",
+                            ((url, now) for url in state["processed_urls"]))
+        self.db.executemany("INSERT OR IGNORE INTO failed VALUES (?)",
+                            ((url,) for url in state.get("failed_urls", [])))
+        self.db.executemany("INSERT OR IGNORE INTO blocked VALUES (?, ?)",
+                            ((url, now) for url in state.get("blocked_urls", [])))
+        self.db.executemany("INSERT INTO daily_counts VALUES (?, ?)", state.get("daily_counts", {}).items())
+        for name in self.counters:
+            self.counters[name] = state.get(name, self.counters[name])
+
+        if journal_path.exists():
+            with open(journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        entry = loads(line)
+                    except ValueError:
+                        # Blank or partial last line from an interrupted write
+                        continue
+                    if entry["op"] == "processed":
+                        self._add_processed(entry["url"], entry["day"])
+                    elif entry["op"] == "failed":
+                        self._add_failed(entry["url"])
+                    elif entry["op"] == "blocked":
+                        self._add_blocked(entry["url"], entry["backoff"], entry["time"])
+        return True
+
+    def _add_processed(self, url: str, day: str):
+        cur = self.db.execute("INSERT OR IGNORE INTO processed VALUES (?, ?)", (url, int(time.time())))
+        if cur.rowcount:
+            # Reset consecutive blocks on success
+            self.counters["consecutive_blocks"] = 0
+            # Track daily count
+            self.db.execute(
+                "INSERT INTO daily_counts VALUES (?, 1) ON CONFLICT(day) DO UPDATE SET count = count + 1",
+                (day,),
+            )
+
+    def _add_failed(self, url: str):
+        self.db.execute("INSERT OR IGNORE INTO failed VALUES (?)", (url,))
+
+    def _add_blocked(self, url: str, backoff: int, when: Any):
+        self.db.execute("INSERT OR IGNORE INTO blocked VALUES (?, ?)", (url, int(time.time())))
+        self.counters["rate_limited_count"] += 1
+        self.counters["consecutive_blocks"] += 1
+        self.counters["last_block_time"] = when
+        self.counters["current_backoff"] = backoff
+
+    def _updated(self):
+        """Count an update and save once a batch has accumulated."""
+        self._pending += 1
+        if self._pending >= CHECKPOINT_SAVE_EVERY:
+            self.save()
+
+    def _commit(self):
+        self.db.executemany("INSERT OR REPLACE INTO counters VALUES (?, ?)", self.counters.items())
+        self.db.commit()
+        self._pending = 0
+
+    def save(self):
+        self._commit()
+        status = dict(self.stats)
+        status["last_block_time"] = self.counters["last_block_time"]
+        status["current_backoff"] = self.counters["current_backoff"]
+        status["daily_counts"] = dict(self.db.execute("SELECT day, count FROM daily_counts"))
+        status["last_updated"] = int(time.time())
+        # Replaced atomically, so the dashboard never reads a half-written file
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(dumps(status))
+        os.replace(tmp_path, self.path)
+
+    def _today(self) -> str:
+        """Today's date as YYYY-MM-DD, recomputed only after local midnight."""
+        if time.time() >= self._today_expiry:
+            now = datetime.now()
+            self._today_str = now.strftime("%Y-%m-%d")
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            self._today_expiry = midnight.timestamp()
+        return self._today_str
+
+    @property
+    def consecutive_blocks(self) -> int:
+        return self.counters["consecutive_blocks"]
+
+    def is_processed(self, url: str) -> bool:
+        return self.db.execute("SELECT 1 FROM processed WHERE url = ? LIMIT 1", (url,)).fetchone() is not None
+
+    def mark_processed(self, url: str):
+        self._add_processed(url, self._today())
+        self._updated()
+
+    def mark_failed(self, url: str):
+        self._add_failed(url)
+        self._updated()
+
+    def mark_blocked(self, url: str, backoff: int):
+        self._add_blocked(url, backoff, int(time.time()))
+        self._updated()
+
+    def get_today_count(self) -> int:
+        row = self.db.execute("SELECT count FROM daily_counts WHERE day = ?", (self._today(),)).fetchone()
+        return row[0] if row else 0
+
+    def should_stop_for_day(self, daily_limit: Optional[int]) -> bool:
+        if daily_limit is None:
+            return False
+        return self.get_today_count() >= daily_limit
+
+    def reset(self):
+        for table in ("processed", "failed", "blocked", "daily_counts", "counters"):
+            self.db.execute(f"DELETE FROM {table}")
+        self.counters = {
+            "rate_limited_count": 0,
+            "consecutive_blocks": 0,
+            "last_block_time": None,
+            "current_backoff": 0,
+        }
+        self.save()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        def count(table: str) -> int:
+            return self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+        return {
+            "processed": count("processed"),
+            "failed": count("failed"),
+            "blocked": count("blocked"),
+            "rate_limited_total": self.counters["rate_limited_count"],
+            "consecutive_blocks": self.counters["consecutive_blocks"],
+            "today_count": self.get_today_count(),
+        }
 
 
 def url_to_build_id(url: str) -> int:
- """Convert URL to unique build_id using MD5 hash."""
- md5 = hashlib.md5(url.strip().encode()).digest()
- return int.from_bytes(md5[:8], "little", signed=False) % (1 << 63)
+    """Convert URL to unique build_id using MD5 hash."""
+    md5 = hashlib.md5(url.strip().encode()).digest()
+    return int.from_bytes(md5[:8], "little", signed=False) % (1 << 63)
+
+
+def write_bytes_raw(path: Path, data: bytes) -> None:
+    """Write data to path with os-level calls, skipping the Python file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+class ShardWriter:
+    """Append HTML pages to shard_NNNNN.tar files, starting a new shard every shard_size pages."""
+
+    def __init__(self, shard_dir: Path, shard_size: int):
+        self.shard_dir = shard_dir
+        self.shard_size = shard_size
+        # Each session starts a fresh shard after any existing ones
+        self._index = len(list(shard_dir.glob("shard_*.tar")))
+        self._shard = None
+        self._count = 0
+
+    def add(self, name: str, data: bytes):
+        if self._shard is None or self._count >= self.shard_size:
+            self.close()
+            self._shard = tarfile.open(self.shard_dir / f"shard_{self._index:05d}.tar", "w")
+            self._index += 1
+            self._count = 0
+        info = tarfile.TarInfo(name=name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        self._shard.addfile(info, io.BytesIO(data))
+        self._shard.fileobj.flush()
+        self._count += 1
+
+    def close(self):
+        if self._shard is not None:
+            self._shard.close()
+            self._shard = None
 
 
 def load_urls_from_json(json_path: Path) -> List[str]:
- """Load URLs from urls.json file."""
- with open(json_path, "r") as f:
- data = json.load(f)
- 
- if isinstance(data, dict) and "urls" in data:
- urls_data = data["urls"]
- if isinstance(urls_data, list) and len(urls_data) > 0:
- if isinstance(urls_data[0], dict):
- return [item["url"] for item in urls_data if isinstance(item, dict) and "url" in item]
- else:
- return urls_data
- return []
- elif isinstance(data, list):
- return data
- else:
- raise ValueError(f"Unknown JSON format in {json_path}")
+    """Load URLs from urls.json file."""
+    with open(json_path, "rb") as f:
+        data = loads(f.read())
+
+    if isinstance(data, dict) and "urls" in data:
+        urls_data = data["urls"]
+        if isinstance(urls_data, list) and len(urls_data) > 0:
+            if isinstance(urls_data[0], dict):
+                return [item["url"] for item in urls_data if isinstance(item, dict) and "url" in item]
+            else:
+                return urls_data
+        return []
+    elif isinstance(data, list):
+        return data
+    else:
+        raise ValueError(f"Unknown JSON format in {json_path}")
 
 
 class AggressiveStealthScraper:
- """
- Stealth scraper with aggressive anti-detection for protected sites.
- 
- Key features:
- - Exponential backoff on rate limits
- - Very long delays between requests
- - Frequent session rotation
- - Daily scraping limits
- - Human-like timing variations
- """
- 
- def __init__(self, config: AggressiveStealthConfig, checkpoint: SmartCheckpointManager):
- self.config = config
- self.checkpoint = checkpoint
- self.stats = {"processed": 0, "failed": 0, "blocked": 0}
- self._browser = None
- self._context = None
- self._page = None
- self._pages_used = 0
- self._current_backoff = config.initial_backoff
- 
- async def _init_browser(self):
- """Initialize Camoufox browser with aggressive stealth settings."""
- # Randomize OS for each session
- os_choice = random.choice(["windows", "macos", "linux"])
- 
- launch_kwargs = {
- "headless": self.config.headless,
- "humanize": True,
- "os": os_choice,
- "block_webrtc": True,
- "block_images": False, # Keep images to look more natural
- }
- 
- # More aggressive canvas fingerprint variation
- launch_kwargs["config"] = {
- "canvas:aaOffset": random.randint(1, 5),
- "canvas:aaCapOffset": True,
- }
- 
- if self.config.proxy_dict:
- launch_kwargs["proxy"] = self.config.proxy_dict
- launch_kwargs["geoip"] = True
- logger.info(f"Using proxy: {self.config.proxy_host}:{self.config.proxy_port}")
- else:
- # Randomize locale when no proxy
- locales = ["en-US", "en-GB", "en-CA", "en-AU"]
- launch_kwargs["locale"] = random.choice(locales)
- logger.info("No proxy - using direct connection (recommend using residential proxy)")
- 
- self._camoufox_ctx = AsyncCamoufox(**launch_kwargs)
- self._browser = await self._camoufox_ctx.__aenter__()
- self._context = await self._browser.new_context(
- ignore_https_errors=True,
- # Add some randomized viewport
- viewport={
- "width": random.randint(1280, 1920),
- "height": random.randint(800, 1080),
- }
- )
- self._page = await self._context.new_page()
- self._pages_used = 0
- 
- logger.info(f"Camoufox browser initialized (OS: {os_choice})")
- 
- async def _rotate_session(self):
- """Rotate browser session with random delay."""
- logger.info("Rotating browser session...")
- 
- # Random delay before rotation
- await asyncio.sleep(random.uniform(3, 8))
- 
- if self._page:
- await self._page.close()
- if self._context:
- await self._context.close()
- 
- # New context with fresh fingerprint
- self._context = await self._browser.new_context(
- ignore_https_errors=True,
- viewport={
- "width": random.randint(1280, 1920),
- "height": random.randint(800, 1080),
- }
- )
- self._page = await self._context.new_page()
- self._pages_used = 0
- 
- # Longer delay after rotation
- await asyncio.sleep(random.uniform(5, 10))
- logger.info("Session rotated")
- 
- async def _close_browser(self):
- """Clean up browser resources."""
- if self._page:
- try:
- await self._page.close()
- except:
- pass
- if self._context:
- try:
- await self._context.close()
- except:
- pass
- if self._camoufox_ctx:
- try:
- await self._camoufox_ctx.__aexit__(None, None, None)
- except:
- pass
- logger.info("Browser closed")
- 
- async def _handle_rate_limit(self) -> bool:
- """
- Handle rate limit with exponential backoff.
- Returns True if should continue, False if should stop.
- """
- consecutive = self.checkpoint.state["consecutive_blocks"]
- 
- # Calculate backoff with exponential increase
- backoff = min(
- self.config.initial_backoff * (2 ** consecutive),
- self.config.max_backoff
- )
- 
- self._current_backoff = backoff
- 
- logger.warning(f"Rate limited! Consecutive blocks: {consecutive}")
- logger.warning(f"Backing off for {backoff // 60} minutes...")
- 
- # If too many consecutive blocks, suggest stopping
- if consecutive >= 5:
- logger.error("Too many consecutive blocks (5+). Stopping to avoid ban.")
- logger.error("RECOMMENDATION: Wait 24 hours before retrying, or use a proxy.")
- return False
- 
- # Rotate session before waiting
- await self._rotate_session()
- 
- # Wait with progress updates
- for i in range(backoff):
- if shutdown_event.is_set():
- return False
- if i % 60 == 0:
- remaining = (backoff - i) // 60
- logger.info(f"Backoff: {remaining} minutes remaining...")
- await asyncio.sleep(1)
- 
- return True
- 
- async def scrape_url(self, url: str) -> Optional[Dict[str, Any]]:
- """Scrape a single URL with enhanced anti-detection."""
- try:
- # Add random referrer
- referrers = [
- "https://www.google.com/",
- "https://www.google.co.uk/",
- "https://www.bing.com/",
- "https://duckduckgo.com/",
- "", # No referrer sometimes
- ]
- await self._page.set_extra_http_headers({
- "Referer": random.choice(referrers),
- "Accept-Language": "en-GB,en;q=0.9,en-US;q=0.8",
- })
- 
- response = await self._page.goto(
- url,
- wait_until="domcontentloaded",
- timeout=self.config.timeout,
- )
- 
- if not response:
- logger.warning(f"No response for {url}")
- return None
- 
- status = response.status
- 
- # Handle rate limiting
- if status == 429:
- logger.warning(f"RATE LIMITED (429) on {url}")
- self.checkpoint.mark_blocked(url, self._current_backoff)
- self.stats["blocked"] += 1
- return {"rate_limited": True}
- 
- # Handle other blocks
- if status == 403:
- logger.warning(f"BLOCKED (403) on {url}")
- self.checkpoint.mark_blocked(url, self._current_backoff)
- self.stats["blocked"] += 1
- return {"rate_limited": True}
- 
- if status >= 400:
- logger.warning(f"HTTP {status} on {url}")
- return None
- 
- # Wait for JS to settle - longer wait
- await asyncio.sleep(random.uniform(1.0, 2.5))
- 
- html = await self._page.content()
- 
- if not html or len(html) < 500:
- logger.warning(f"Empty/short HTML for {url}")
- return None
- 
- # Check for Cloudflare/captcha
- html_lower = html.lower()
- if "challenge" in html_lower and "cloudflare" in html_lower:
- logger.warning(f"Cloudflare challenge on {url}")
- self.checkpoint.mark_blocked(url, self._current_backoff)
- self.stats["blocked"] += 1
- return {"rate_limited": True}
- 
- # Check for "too many requests" in content
- if "too many requests" in html_lower or "rate limit" in html_lower:
- logger.warning(f"Rate limit message in content on {url}")
- self.checkpoint.mark_blocked(url, self._current_backoff)
- self.stats["blocked"] += 1
- return {"rate_limited": True}
- 
- return {
- "build_id": url_to_build_id(url),
- "url": url,
- "html": html,
- "scraped_at": datetime.now().isoformat(),
- "status_code": status,
- }
- 
- except Exception as e:
- logger.error(f"Error scraping {url}: {e}")
- return None
- 
- def _human_delay(self) -> float:
- """Generate human-like delay with variation."""
- # Base delay
- base = random.uniform(self.config.min_delay, self.config.max_delay)
- 
- # Sometimes add extra "thinking" time (20% chance)
- if random.random() < 0.2:
- base += random.uniform(5, 15)
- 
- # Sometimes very short pause (10% chance, simulating quick navigation)
- if random.random() < 0.1:
- base = random.uniform(3, 5)
- 
- return base
- 
- async def run(self, urls: List[str], limit: Optional[int] = None) -> Dict[str, int]:
- """Run the aggressive stealth scraper."""
- if not CAMOUFOX_AVAILABLE:
- logger.error("Camoufox not installed! Run: pip install camoufox[geoip]")
- return self.stats
- 
- # Check daily limit
- if self.checkpoint.should_stop_for_day(self.config.daily_limit):
- today_count = self.checkpoint.get_today_count()
- logger.info(f"Daily limit reached ({today_count}/{self.config.daily_limit}). Try again tomorrow!")
- return self.stats
- 
- # Filter already processed URLs
- pending = [u for u in urls if not self.checkpoint.is_processed(u)]
- 
- if limit:
- pending = pending[:limit]
- 
- # Apply daily limit
- if self.config.daily_limit:
- remaining_today = self.config.daily_limit - self.checkpoint.get_today_count()
- pending = pending[:remaining_today]
- 
- logger.info(f"URLs to process: {len(pending)} (skipping {len(urls) - len(pending)} already done)")
- 
- if not pending:
- logger.info("All URLs already processed!")
- return self.stats
- 
- # Setup output
- self.config.output_dir.mkdir(parents=True, exist_ok=True)
- html_dir = self.config.output_dir / "html"
- html_dir.mkdir(exist_ok=True)
- 
- timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
- output_file = self.config.output_dir / f"scraped_{timestamp}.jsonl"
- 
- try:
- await self._init_browser()
- 
- with open(output_file, "ab") as f:
- if TQDM_AVAILABLE:
- pbar = async_tqdm(total=len(pending), desc="Aggressive Stealth Scraping")
- else:
- pbar = None
- 
- for i, url in enumerate(pending):
- if shutdown_event.is_set():
- logger.info("Shutdown requested, saving progress...")
- break
- 
- # Check daily limit again
- if self.checkpoint.should_stop_for_day(self.config.daily_limit):
- logger.info("Daily limit reached. Stopping for today.")
- break
- 
- # Session rotation - more frequent
- if self._pages_used > 0 and self._pages_used % self.config.rotate_every == 0:
- await self._rotate_session()
- 
- # Human-like delay
- delay = self._human_delay()
- logger.debug(f"Waiting {delay:.1f}s before next request...")
- await asyncio.sleep(delay)
- 
- # Clear cookies periodically
- if i > 0 and i % 50 == 0:
- await self._context.clear_cookies()
- logger.info("Cleared cookies")
- 
- result = await self.scrape_url(url)
- self._pages_used += 1
- 
- if result and result.get("rate_limited"):
- # Handle rate limit
- should_continue = await self._handle_rate_limit()
- if not should_continue:
- logger.error("Stopping due to repeated rate limits")
- break
- continue
- 
- if result and "html" in result:
- # Save to JSONL (without HTML for space)
- result_meta = {k: v for k, v in result.items() if k != "html"}
- if orjson:
- f.write(orjson.dumps(result_meta) + b"\n")
- else:
- f.write(json.dumps(result_meta).encode() + b"\n")
- f.flush()
- 
- # Save HTML separately
- html_file = html_dir / f"{result['build_id']}.html"
- html_file.write_text(result["html"])
- 
- self.checkpoint.mark_processed(url)
- self.stats["processed"] += 1
- 
- # Reset backoff on success
- self._current_backoff = self.config.initial_backoff
- else:
- self.checkpoint.mark_failed(url)
- self.stats["failed"] += 1
- 
- if pbar:
- pbar.update(1)
- pbar.set_postfix(
- ok=self.stats["processed"],
- fail=self.stats["failed"],
- block=self.stats["blocked"],
- today=self.checkpoint.get_today_count(),
- )
- 
- # Checkpoint every 10 URLs (more frequent for aggressive scraping)
- if (self.stats["processed"] + self.stats["failed"]) % 10 == 0:
- self.checkpoint.save()
- 
- if pbar:
- pbar.close()
- 
- finally:
- await self._close_browser()
- self.checkpoint.save()
- 
- logger.info(f"\n{'='*60}")
- logger.info("Scraping session complete!")
- logger.info(f"Processed: {self.stats['processed']}")
- logger.info(f"Failed: {self.stats['failed']}")
- logger.info(f"Blocked: {self.stats['blocked']}")
- logger.info(f"Today's total: {self.checkpoint.get_today_count()}")
- logger.info(f"Output: {output_file}")
- 
- if self.stats["blocked"] > 0:
- logger.warning("\n RECOMMENDATIONS TO AVOID BLOCKS:")
- logger.warning(" 1. Use a residential proxy (BrightData, Oxylabs)")
- logger.warning(" 2. Set --daily-limit 50-100 to spread over days")
- logger.warning(" 3. Run during off-peak hours (night/weekend)")
- logger.warning(" 4. Wait 24+ hours if heavily rate limited")
- 
- logger.info(f"{'='*60}")
- 
- return self.stats
+    """
+    Stealth scraper with aggressive anti-detection for protected sites.
+
+    Key features:
+    - Exponential backoff on rate limits
+    - Very long delays between requests
+    - Frequent session rotation across a pool of pre-warmed contexts
+    - Daily scraping limits
+    - Human-like timing variations
+    """
+
+    def __init__(self, config: AggressiveStealthConfig, checkpoint: SmartCheckpointManager):
+        self.config = config
+        self.checkpoint = checkpoint
+        self.stats = {"processed": 0, "failed": 0, "blocked": 0}
+        self._browser = None
+        self._context = None
+        self._page = None
+        self._contexts: List[Any] = []
+        self._pages: List[Any] = []
+        self._ctx_idx = 0
+        self._recycling: Dict[int, asyncio.Task] = {}
+        self._pages_used = 0
+        self._current_backoff = config.initial_backoff
+
+    async def _init_browser(self):
+        """Initialize Camoufox browser with aggressive stealth settings."""
+        from camoufox.async_api import AsyncCamoufox
+
+        # Randomize OS for each session
+        os_choice = random.choice(BROWSER_OS_CHOICES)
+
+        launch_kwargs = {
+            "headless": self.config.headless,
+            "humanize": True,
+            "os": os_choice,
+            "block_webrtc": True,
+            "block_images": False,  # Keep images to look more natural
+        }
+
+        # More aggressive canvas fingerprint variation
+        launch_kwargs["config"] = {
+            "canvas:aaOffset": random.randint(1, 5),
+            "canvas:aaCapOffset": True,
+        }
+
+        if self.config.proxy_dict:
+            launch_kwargs["proxy"] = self.config.proxy_dict
+            launch_kwargs["geoip"] = True
+            logger.info(f"Using proxy: {self.config.proxy_host}:{self.config.proxy_port}")
+        else:
+            # Randomize locale when no proxy
+            launch_kwargs["locale"] = random.choice(LOCALES)
+            logger.info("No proxy - using direct connection (recommend using residential proxy)")
+
+        self._camoufox_ctx = AsyncCamoufox(**launch_kwargs)
+        self._browser = await self._camoufox_ctx.__aenter__()
+
+        # Pre-warm the context pool so rotation never waits on context creation
+        sessions = [await self._new_session() for _ in range(CONTEXT_POOL_SIZE)]
+        self._contexts = [ctx for ctx, _ in sessions]
+        self._pages = [page for _, page in sessions]
+        self._ctx_idx = 0
+        self._context = self._contexts[0]
+        self._page = self._pages[0]
+        self._pages_used = 0
+
+        logger.info(f"Camoufox browser initialized (OS: {os_choice})")
+
+    async def _new_session(self):
+        """Create a context with a fresh fingerprint and its page."""
+        context = await self._browser.new_context(
+            ignore_https_errors=True,
+            # Add some randomized viewport
+            viewport={
+                "width": random.randint(1280, 1920),
+                "height": random.randint(800, 1080),
+            }
+        )
+        return context, await context.new_page()
+
+    async def _recycle(self, idx: int):
+        """Replace the context in pool slot idx with a fresh one; the slot is left empty (None) if that fails."""
+        old_page, old_context = self._pages[idx], self._contexts[idx]
+        self._contexts[idx] = self._pages[idx] = None
+        if old_context is not None:
+            try:
+                await old_page.close()
+                await old_context.close()
+            except Exception as e:
+                logger.debug(f"Error closing recycled context: {e}")
+        try:
+            self._contexts[idx], self._pages[idx] = await self._new_session()
+        except Exception as e:
+            logger.error(f"Error creating browser context for pool slot {idx}: {e}")
+
+    async def _rotate_session(self):
+        """Rotate to the next pre-warmed context and recycle the used one in the background."""
+        logger.info("Rotating browser session...")
+
+        # Random delay before rotation
+        await asyncio.sleep(random.uniform(3, 8))
+
+        old_idx = self._ctx_idx
+        size = len(self._contexts)
+        for step in range(1, size):
+            idx = (old_idx + step) % size
+            # The slot may still be recycling from an earlier rotation
+            pending = self._recycling.pop(idx, None)
+            if pending:
+                await pending
+            if self._contexts[idx] is not None:
+                break
+            # Its recycle failed; retry in the background and try the next slot
+            self._recycling[idx] = asyncio.create_task(self._recycle(idx))
+        else:
+            logger.warning("No fresh browser context available, keeping the current session")
+            self._pages_used = 0
+            return
+
+        self._ctx_idx = idx
+        self._context = self._contexts[self._ctx_idx]
+        self._page = self._pages[self._ctx_idx]
+        self._recycling[old_idx] = asyncio.create_task(self._recycle(old_idx))
+        self._pages_used = 0
+
+        # Longer delay after rotation
+        await asyncio.sleep(random.uniform(5, 10))
+        logger.info("Session rotated")
+
+    async def _close_browser(self):
+        """Clean up browser resources."""
+        for task in self._recycling.values():
+            try:
+                await task
+            except:
+                pass
+        self._recycling.clear()
+        for page in self._pages:
+            if page is None:
+                continue
+            try:
+                await page.close()
+            except:
+                pass
+        for context in self._contexts:
+            if context is None:
+                continue
+            try:
+                await context.close()
+            except:
+                pass
+        if self._camoufox_ctx:
+            try:
+                await self._camoufox_ctx.__aexit__(None, None, None)
+            except:
+                pass
+        logger.info("Browser closed")
+
+    async def _handle_rate_limit(self) -> bool:
+        """
+        Handle rate limit with exponential backoff.
+        Returns True if should continue, False if should stop.
+        """
+        consecutive = self.checkpoint.consecutive_blocks
+
+        # Calculate backoff with exponential increase
+        backoff = min(
+            self.config.initial_backoff * (2 ** consecutive),
+            self.config.max_backoff
+        )
+
+        self._current_backoff = backoff
+
+        logger.warning(f"Rate limited! Consecutive blocks: {consecutive}")
+        logger.warning(f"Backing off for {backoff // 60} minutes...")
+
+        # If too many consecutive blocks, suggest stopping
+        if consecutive >= 5:
+            logger.error("Too many consecutive blocks (5+). Stopping to avoid ban.")
+            logger.error("RECOMMENDATION: Wait 24 hours before retrying, or use a proxy.")
+            return False
+
+        # Rotate session before waiting
+        await self._rotate_session()
+
+        # Wait with progress updates, waking once per minute (or on shutdown)
+        end = time.monotonic() + backoff
+        while time.monotonic() < end:
+            remaining = end - time.monotonic()
+            logger.info(f"Backoff: {int(remaining) // 60} minutes remaining...")
+            try:
+                await asyncio.wait_for(shutdown_event.wait(), timeout=min(60, remaining))
+                return False
+            except asyncio.TimeoutError:
+                continue
+
+        return not shutdown_event.is_set()
+
+    async def scrape_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """Scrape a single URL with enhanced anti-detection."""
+        try:
+            # Add random referrer
+            await self._page.set_extra_http_headers({
+                "Referer": random.choice(REFERRERS),
+                "Accept-Language": "en-GB,en;q=0.9,en-US;q=0.8",
+            })
+
+            response = await self._page.goto(
+                url,
+                wait_until="domcontentloaded",
+                timeout=self.config.timeout,
+            )
+
+            if not response:
+                logger.warning(f"No response for {url}")
+                return None
+
+            status = response.status
+
+            # Handle rate limiting
+            if status == 429:
+                logger.warning(f"RATE LIMITED (429) on {url}")
+                self.checkpoint.mark_blocked(url, self._current_backoff)
+                self.stats["blocked"] += 1
+                return {"rate_limited": True}
+
+            # Handle other blocks
+            if status == 403:
+                logger.warning(f"BLOCKED (403) on {url}")
+                self.checkpoint.mark_blocked(url, self._current_backoff)
+                self.stats["blocked"] += 1
+                return {"rate_limited": True}
+
+            if status >= 400:
+                logger.warning(f"HTTP {status} on {url}")
+                return None
+
+            # Wait for JS to settle - longer wait
+            await asyncio.sleep(random.uniform(1.0, 2.5))
+
+            html = await self._page.content()
+
+            if not html or len(html) < 500:
+                logger.warning(f"Empty/short HTML for {url}")
+                return None
+
+            html_bytes = html.encode("utf-8")
+            markers = {m.lastgroup for m in BLOCK_MARKERS_RE.finditer(html_bytes)}
+
+            # Check for Cloudflare/captcha
+            if "challenge" in markers and "cloudflare" in markers:
+                logger.warning(f"Cloudflare challenge on {url}")
+                self.checkpoint.mark_blocked(url, self._current_backoff)
+                self.stats["blocked"] += 1
+                return {"rate_limited": True}
+
+            # Check for "too many requests" in content
+            if "rate_limit" in markers:
+                logger.warning(f"Rate limit message in content on {url}")
+                self.checkpoint.mark_blocked(url, self._current_backoff)
+                self.stats["blocked"] += 1
+                return {"rate_limited": True}
+
+            return {
+                "build_id": url_to_build_id(url),
+                "url": url,
+                "html_bytes": html_bytes,
+                "scraped_at": datetime.now().isoformat(),
+                "status_code": status,
+            }
+
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {e}")
+            return None
+
+    def _human_delay(self) -> float:
+        """Generate human-like delay with variation."""
+        # Base delay
+        base = random.uniform(self.config.min_delay, self.config.max_delay)
+
+        # Sometimes add extra "thinking" time (20% chance)
+        if random.random() < 0.2:
+            base += random.uniform(5, 15)
+
+        # Sometimes very short pause (10% chance, simulating quick navigation)
+        if random.random() < 0.1:
+            base = random.uniform(3, 5)
+
+        return base
+
+    def _save_html(self, html_dir: Path, shards: Optional[ShardWriter], build_id: int, data: bytes):
+        """Write one page's HTML as a loose file or into the current shard."""
+        if self.config.compress_html:
+            html_name = f"{build_id}.html.gz"
+            data = gzip.compress(data, compresslevel=1)
+        else:
+            html_name = f"{build_id}.html"
+        if shards:
+            shards.add(html_name, data)
+        else:
+            write_bytes_raw(html_dir / html_name, data)
+
+    def _save_page(self, out, html_dir: Path, shards: Optional[ShardWriter], result: Dict[str, Any]):
+        """Write one page's HTML, then its JSONL metadata line (without the HTML), flushed."""
+        self._save_html(html_dir, shards, result["build_id"], result["html_bytes"])
+        out.write(dumps_line({k: v for k, v in result.items() if k != "html_bytes"}))
+        out.flush()
+
+    async def _page_writer(self, queue: asyncio.Queue, out, html_dir: Path, shards: Optional[ShardWriter]):
+        """
+        Save queued scrape results in a worker thread until a None arrives.
+
+        A URL is marked processed only once its HTML and metadata are written, so
+        a crash leaves unsaved pages to be scraped again on the next run.
+        """
+        while True:
+            result = await queue.get()
+            if result is None:
+                return
+            try:
+                await asyncio.to_thread(self._save_page, out, html_dir, shards, result)
+            except Exception as e:
+                logger.error(f"Error saving {result['url']}: {e}")
+                continue
+            self.checkpoint.mark_processed(result["url"])
+
+    async def run(self, urls: List[str], limit: Optional[int] = None) -> Dict[str, int]:
+        """Run the aggressive stealth scraper."""
+        if not CAMOUFOX_AVAILABLE:
+            logger.error("Camoufox not installed! Run: pip install camoufox[geoip]")
+            return self.stats
+
+        # Check daily limit
+        if self.checkpoint.should_stop_for_day(self.config.daily_limit):
+            today_count = self.checkpoint.get_today_count()
+            logger.info(f"Daily limit reached ({today_count}/{self.config.daily_limit}). Try again tomorrow!")
+            return self.stats
+
+        # Filter already processed URLs
+        pending = [u for u in urls if not self.checkpoint.is_processed(u)]
+
+        if limit:
+            pending = pending[:limit]
+
+        # Apply daily limit
+        if self.config.daily_limit:
+            remaining_today = self.config.daily_limit - self.checkpoint.get_today_count()
+            pending = pending[:remaining_today]
+
+        logger.info(f"URLs to process: {len(pending)} (skipping {len(urls) - len(pending)} already done)")
+
+        if not pending:
+            logger.info("All URLs already processed!")
+            return self.stats
+
+        # Setup output
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+        html_dir = self.config.output_dir / "html"
+        html_dir.mkdir(exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = self.config.output_dir / f"scraped_{timestamp}.jsonl"
+
+        shards = None
+        f = None
+        # Disk writes happen off the event loop while the next page loads
+        page_queue: asyncio.Queue = asyncio.Queue()
+        page_writer = None
+
+        try:
+            shards = ShardWriter(html_dir, self.config.shard_size) if self.config.shard_size > 0 else None
+            f = open(output_file, "ab")
+            page_writer = asyncio.create_task(self._page_writer(page_queue, f, html_dir, shards))
+
+            await self._init_browser()
+
+            if TQDM_AVAILABLE:
+                pbar = async_tqdm(total=len(pending), desc="Aggressive Stealth Scraping")
+            else:
+                pbar = None
+
+            for i, url in enumerate(pending):
+                if shutdown_event.is_set():
+                    logger.info("Shutdown requested, saving progress...")
+                    break
+
+                # Check daily limit again
+                if self.checkpoint.should_stop_for_day(self.config.daily_limit):
+                    logger.info("Daily limit reached. Stopping for today.")
+                    break
+
+                # Session rotation - more frequent
+                if self._pages_used > 0 and self._pages_used % self.config.rotate_every == 0:
+                    await self._rotate_session()
+
+                # Human-like delay
+                delay = self._human_delay()
+                logger.debug(f"Waiting {delay:.1f}s before next request...")
+                await asyncio.sleep(delay)
+
+                # Clear cookies periodically
+                if i > 0 and i % 50 == 0:
+                    await self._context.clear_cookies()
+                    logger.info("Cleared cookies")
+
+                result = await self.scrape_url(url)
+                self._pages_used += 1
+
+                if result and result.get("rate_limited"):
+                    # Handle rate limit
+                    should_continue = await self._handle_rate_limit()
+                    if not should_continue:
+                        logger.error("Stopping due to repeated rate limits")
+                        break
+                    continue
+
+                if result and "html_bytes" in result:
+                    # Saved (HTML separately, JSONL without it) and marked processed by the writer
+                    page_queue.put_nowait(result)
+                    self.stats["processed"] += 1
+
+                    # Reset backoff on success
+                    self._current_backoff = self.config.initial_backoff
+                else:
+                    self.checkpoint.mark_failed(url)
+                    self.stats["failed"] += 1
+
+                if pbar:
+                    pbar.update(1)
+                    pbar.set_postfix(
+                        ok=self.stats["processed"],
+                        fail=self.stats["failed"],
+                        block=self.stats["blocked"],
+                        today=self.checkpoint.get_today_count(),
+                    )
+
+            if pbar:
+                pbar.close()
+
+        finally:
+            # Drain pending page writes
+            if page_writer:
+                page_queue.put_nowait(None)
+                await page_writer
+            if f:
+                f.close()
+            if shards:
+                shards.close()
+            await self._close_browser()
+            self.checkpoint.save()
+
+        logger.info(f"\n{'='*60}")
+        logger.info("Scraping session complete!")
+        logger.info(f"Processed: {self.stats['processed']}")
+        logger.info(f"Failed: {self.stats['failed']}")
+        logger.info(f"Blocked: {self.stats['blocked']}")
+        logger.info(f"Today's total: {self.checkpoint.get_today_count()}")
+        logger.info(f"Output: {output_file}")
+
+        if self.stats["blocked"] > 0:
+            logger.warning("\n RECOMMENDATIONS TO AVOID BLOCKS:")
+            logger.warning(" 1. Use a residential proxy (BrightData, Oxylabs)")
+            logger.warning(" 2. Set --daily-limit 50-100 to spread over days")
+            logger.warning(" 3. Run during off-peak hours (night/weekend)")
+            logger.warning(" 4. Wait 24+ hours if heavily rate limited")
+
+        logger.info(f"{'='*60}")
+
+        return self.stats
 
 
 async def main():
- parser = argparse.ArgumentParser(
- description="Aggressive Stealth Scraper for protected sites",
- formatter_class=argparse.RawDescriptionHelpFormatter,
- epilog="""
+    parser = argparse.ArgumentParser(
+        description="Aggressive Stealth Scraper for protected sites",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
 Examples:
  # Scrape pistonheads with daily limit
  python aggressive_stealth_scraper.py --source pistonheads_auctions --daily-limit 50
@@ -662,92 +923,97 @@ TIPS FOR AVOIDING BLOCKS:
  - Run during off-peak hours
  - If blocked, wait 24+ hours before retrying
  """
- )
- 
- input_group = parser.add_mutually_exclusive_group(required=True)
- input_group.add_argument("--source", "-s", type=str, help="Source ID from sources.json")
- input_group.add_argument("--urls-file", "-f", type=Path, help="Path to urls.json file")
- 
- parser.add_argument("--limit", "-l", type=int, help="Limit URLs to scrape this session")
- parser.add_argument("--daily-limit", type=int, default=50, help="Max URLs per day (default: 50)")
- parser.add_argument("--reset", action="store_true", help="Reset checkpoint")
- parser.add_argument("--no-headless", action="store_true", help="Show browser window")
- 
- # Timing (with higher defaults)
- parser.add_argument("--min-delay", type=float, default=8.0, help="Min delay between requests (default: 8s)")
- parser.add_argument("--max-delay", type=float, default=20.0, help="Max delay between requests (default: 20s)")
- parser.add_argument("--rotate-every", type=int, default=12, help="Rotate session every N pages (default: 12)")
- 
- # Backoff
- parser.add_argument("--initial-backoff", type=int, default=300, help="Initial backoff in seconds (default: 300 = 5min)")
- parser.add_argument("--max-backoff", type=int, default=1800, help="Max backoff in seconds (default: 1800 = 30min)")
- 
- args = parser.parse_args()
- 
- script_dir = Path(__file__).parent
- project_root = script_dir.parent.parent
- 
- if args.source:
- sources_file = project_root / "scripts" / "ralph" / "sources.json"
- with open(sources_file) as f:
- sources_data = json.load(f)
- 
- source = None
- for s in sources_data["sources"]:
- if s["id"] == args.source:
- source = s
- break
- 
- if not source:
- logger.error(f"Source '{args.source}' not found in sources.json")
- sys.exit(1)
- 
- output_dir = project_root / source["outputDir"]
- urls_file = output_dir / "urls.json"
- 
- if not urls_file.exists():
- logger.error(f"URLs file not found: {urls_file}")
- sys.exit(1)
- else:
- urls_file = args.urls_file
- output_dir = urls_file.parent
- 
- urls = load_urls_from_json(urls_file)
- logger.info(f"Loaded {len(urls)} URLs from {urls_file}")
- 
- config = AggressiveStealthConfig(
- output_dir=output_dir,
- min_delay=args.min_delay,
- max_delay=args.max_delay,
- initial_backoff=args.initial_backoff,
- max_backoff=args.max_backoff,
- rotate_every=args.rotate_every,
- daily_limit=args.daily_limit,
- headless=not args.no_headless,
- )
- 
- checkpoint_path = output_dir / "aggressive_checkpoint.json"
- checkpoint = SmartCheckpointManager(checkpoint_path)
- 
- if args.reset:
- logger.info("Resetting checkpoint...")
- checkpoint.reset()
- 
- logger.info(f"\n{'='*60}")
- logger.info("AGGRESSIVE STEALTH SCRAPER")
- logger.info(f"Delays: {config.min_delay}-{config.max_delay}s")
- logger.info(f"Session rotation: every {config.rotate_every} pages")
- logger.info(f"Daily limit: {config.daily_limit}")
- logger.info(f"Initial backoff: {config.initial_backoff // 60} minutes")
- if config.proxy_dict:
- logger.info(f"Proxy: {config.proxy_host}:{config.proxy_port}")
- else:
- logger.warning(" No proxy configured - higher risk of blocks")
- logger.info(f"{'='*60}\n")
- 
- scraper = AggressiveStealthScraper(config, checkpoint)
- await scraper.run(urls, limit=args.limit)
+    )
+
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument("--source", "-s", type=str, help="Source ID from sources.json")
+    input_group.add_argument("--urls-file", "-f", type=Path, help="Path to urls.json file")
+
+    parser.add_argument("--limit", "-l", type=int, help="Limit URLs to scrape this session")
+    parser.add_argument("--daily-limit", type=int, default=50, help="Max URLs per day (default: 50)")
+    parser.add_argument("--reset", action="store_true", help="Reset checkpoint")
+    parser.add_argument("--no-headless", action="store_true", help="Show browser window")
+    parser.add_argument("--compress-html", action="store_true", help="Save HTML gzip-compressed as {build_id}.html.gz")
+    parser.add_argument("--shard-html", type=int, default=0, metavar="N",
+                        help="Pack HTML into html/shard_NNNNN.tar files of N pages instead of one file per page")
+
+    # Timing (with higher defaults)
+    parser.add_argument("--min-delay", type=float, default=8.0, help="Min delay between requests (default: 8s)")
+    parser.add_argument("--max-delay", type=float, default=20.0, help="Max delay between requests (default: 20s)")
+    parser.add_argument("--rotate-every", type=int, default=12, help="Rotate session every N pages (default: 12)")
+
+    # Backoff
+    parser.add_argument("--initial-backoff", type=int, default=300, help="Initial backoff in seconds (default: 300 = 5min)")
+    parser.add_argument("--max-backoff", type=int, default=1800, help="Max backoff in seconds (default: 1800 = 30min)")
+
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent.parent
+
+    if args.source:
+        sources_file = project_root / "scripts" / "ralph" / "sources.json"
+        with open(sources_file) as f:
+            sources_data = json.load(f)
+
+        source = None
+        for s in sources_data["sources"]:
+            if s["id"] == args.source:
+                source = s
+                break
+
+        if not source:
+            logger.error(f"Source '{args.source}' not found in sources.json")
+            sys.exit(1)
+
+        output_dir = project_root / source["outputDir"]
+        urls_file = output_dir / "urls.json"
+
+        if not urls_file.exists():
+            logger.error(f"URLs file not found: {urls_file}")
+            sys.exit(1)
+    else:
+        urls_file = args.urls_file
+        output_dir = urls_file.parent
+
+    urls = load_urls_from_json(urls_file)
+    logger.info(f"Loaded {len(urls)} URLs from {urls_file}")
+
+    config = AggressiveStealthConfig(
+        output_dir=output_dir,
+        min_delay=args.min_delay,
+        max_delay=args.max_delay,
+        initial_backoff=args.initial_backoff,
+        max_backoff=args.max_backoff,
+        rotate_every=args.rotate_every,
+        daily_limit=args.daily_limit,
+        headless=not args.no_headless,
+        compress_html=args.compress_html,
+        shard_size=args.shard_html,
+    )
+
+    checkpoint_path = output_dir / "aggressive_checkpoint.json"
+    checkpoint = SmartCheckpointManager(checkpoint_path)
+
+    if args.reset:
+        logger.info("Resetting checkpoint...")
+        checkpoint.reset()
+
+    logger.info(f"\n{'='*60}")
+    logger.info("AGGRESSIVE STEALTH SCRAPER")
+    logger.info(f"Delays: {config.min_delay}-{config.max_delay}s")
+    logger.info(f"Session rotation: every {config.rotate_every} pages")
+    logger.info(f"Daily limit: {config.daily_limit}")
+    logger.info(f"Initial backoff: {config.initial_backoff // 60} minutes")
+    if config.proxy_dict:
+        logger.info(f"Proxy: {config.proxy_host}:{config.proxy_port}")
+    else:
+        logger.warning(" No proxy configured - higher risk of blocks")
+    logger.info(f"{'='*60}\n")
+
+    scraper = AggressiveStealthScraper(config, checkpoint)
+    await scraper.run(urls, limit=args.limit)
 
 
 if __name__ == "__main__":
- asyncio.run(main())
+    asyncio.run(main())
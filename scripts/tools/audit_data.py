@@ -12,24 +12,54 @@ Usage:
     python scripts/tools/audit_data.py [--verbose] [--json] [--deep]
     python scripts/tools/audit_data.py --source wheelspecialists --deep
     python scripts/tools/audit_data.py --report audit_report.json
+    python scripts/tools/audit_data.py --deep --jobs 8
+    python scripts/tools/audit_data.py --deep --cache .audit_cache.json
+
+Optional:
+    pip install hyperscan  # vectorized HTML error-pattern scanning
+    pip install ijson      # constant-memory URL counting for large urls.json
 """
 
 import argparse
-import json
+import gzip
+import heapq
+import math
+import mmap
 import os
 import re
 import sys
-from collections import defaultdict, Counter
-from dataclasses import dataclass, field, asdict
+import threading
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain, islice, repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Optional
-import random
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from _fast_json import dump_indented, dumps, loads
+from _sampling import reservoir_sample
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -51,55 +81,324 @@ def c(text: str, color: str) -> str:
 # HTML Validation Patterns
 # ============================================================================
 
-# Patterns that indicate blocked/error responses
+# Patterns that indicate blocked/error responses, with the lowercase literals
+# at least one of which appears in any match (used to skip the regex)
 ERROR_PATTERNS = [
     # HTTP errors
-    (r'\b403\s*(forbidden|error)?\b', 'http_403'),
-    (r'\b404\s*(not\s*found|error)?\b', 'http_404'),
-    (r'\b500\s*(internal\s*server|error)?\b', 'http_500'),
-    (r'\b502\s*(bad\s*gateway)?\b', 'http_502'),
-    (r'\b503\s*(service\s*unavailable)?\b', 'http_503'),
+    (r'\b403\s*(forbidden|error)?\b', 'http_403', ('403',)),
+    (r'\b404\s*(not\s*found|error)?\b', 'http_404', ('404',)),
+    (r'\b500\s*(internal\s*server|error)?\b', 'http_500', ('500',)),
+    (r'\b502\s*(bad\s*gateway)?\b', 'http_502', ('502',)),
+    (r'\b503\s*(service\s*unavailable)?\b', 'http_503', ('503',)),
 
     # Anti-bot / WAF
-    (r'cloudflare', 'cloudflare_blocked'),
-    (r'please\s+enable\s+(javascript|cookies)', 'js_required'),
-    (r'captcha|recaptcha|hcaptcha', 'captcha'),
-    (r'access\s+denied', 'access_denied'),
-    (r'blocked|firewall|waf', 'blocked'),
-    (r'rate\s*limit(ed)?', 'rate_limited'),
-    (r'too\s+many\s+requests', 'rate_limited'),
-    (r'bot\s+detection|suspicious\s+activity', 'bot_detected'),
-    (r'ddos[\-\s]protection', 'ddos_protection'),
+    (r'cloudflare', 'cloudflare_blocked', ('cloudflare',)),
+    (r'please\s+enable\s+(javascript|cookies)', 'js_required', ('please',)),
+    (r'captcha|recaptcha|hcaptcha', 'captcha', ('captcha',)),
+    (r'access\s+denied', 'access_denied', ('access',)),
+    (r'blocked|firewall|waf', 'blocked', ('blocked', 'firewall', 'waf')),
+    (r'rate\s*limit(ed)?', 'rate_limited', ('rate',)),
+    (r'too\s+many\s+requests', 'rate_limited', ('too',)),
+    (r'bot\s+detection|suspicious\s+activity', 'bot_detected', ('bot', 'suspicious')),
+    (r'ddos[\-\s]protection', 'ddos_protection', ('ddos',)),
 
     # Page not found / removed
-    (r'page\s*(not\s*found|removed|deleted)', 'page_removed'),
-    (r'(listing|item|vehicle)\s*(no\s*longer|has\s*been)\s*(available|sold|removed)', 'listing_removed'),
-    (r'this\s+(page|listing)\s+(doesn.t|does\s*not)\s*exist', 'page_removed'),
+    (r'page\s*(not\s*found|removed|deleted)', 'page_removed', ('page',)),
+    (r'(listing|item|vehicle)\s*(no\s*longer|has\s*been)\s*(available|sold|removed)', 'listing_removed',
+     ('listing', 'item', 'vehicle')),
+    (r'this\s+(page|listing)\s+(doesn(?:.|’)t|does\s*not)\s*exist', 'page_removed', ('this',)),
 
     # Login required
-    (r'(please\s+)?(log\s*in|sign\s*in)\s+(to\s+(view|access|continue)|required)', 'login_required'),
-    (r'members?\s+only', 'login_required'),
+    (r'(please\s+)?(log\s*in|sign\s*in)\s+(to\s+(view|access|continue)|required)', 'login_required',
+     ('log', 'sign')),
+    (r'members?\s+only', 'login_required', ('member',)),
 
     # Empty / placeholder
-    (r'coming\s+soon', 'placeholder'),
-    (r'under\s+construction', 'placeholder'),
+    (r'coming\s+soon', 'placeholder', ('coming',)),
+    (r'under\s+construction', 'placeholder', ('under',)),
 ]
 
-# Compiled patterns for efficiency
-COMPILED_ERROR_PATTERNS = [(re.compile(p, re.IGNORECASE), name) for p, name in ERROR_PATTERNS]
+# Compiled bytes patterns, so documents are matched undecoded
+COMPILED_ERROR_PATTERNS = [
+    (re.compile(p.encode('utf-8'), re.IGNORECASE), name) for p, name, _ in ERROR_PATTERNS
+]
+
+
+def _index_error_literals() -> dict:
+    """
+    Map each required literal (as bytes) to the ERROR_PATTERNS indexes needing it.
+
+    A literal absent from the lowercased document rules out every pattern
+    listed under it.
+    """
+    index = {}
+    for i, (_, _, literals) in enumerate(ERROR_PATTERNS):
+        for literal in literals:
+            index.setdefault(literal.encode('utf-8'), []).append(i)
+    return index
+
+
+ERROR_PATTERNS_BY_LITERAL = _index_error_literals()
+
+
+def _compile_hyperscan_db():
+    """Compile ERROR_PATTERNS into a Hyperscan database (pattern id = list index)."""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.encode('utf-8') for p, _, _ in ERROR_PATTERNS],
+        ids=list(range(len(ERROR_PATTERNS))),
+        elements=len(ERROR_PATTERNS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(ERROR_PATTERNS),
+    )
+    return db
+
+
+@lru_cache(maxsize=None)
+def hyperscan_db():
+    """
+    The Hyperscan database for ERROR_PATTERNS, or None to use COMPILED_ERROR_PATTERNS.
+
+    Compiled on first use and memoized (compiling costs more than all the
+    other module setup), so runs without HTML validation never pay for it.
+    Also passed as the process-pool initializer, so each worker compiles it
+    once up front rather than inside its first task.
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    try:
+        return _compile_hyperscan_db()
+    except hyperscan.error:
+        return None
+
+
+# Per-thread Hyperscan scratch space: a Scratch can only serve one scan at a time
+_hyperscan_local = threading.local()
+
+
+def _hyperscan_scratch(db):
+    """This thread's Scratch for db, allocated on first use."""
+    scratch = getattr(_hyperscan_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(db)
+    return scratch
+
+
+def find_error_types(content, limit: Optional[int] = None) -> list:
+    """
+    Return the error type of each ERROR_PATTERNS entry found in content, in pattern order.
+
+    content is any bytes-like object (bytes, mmap); only the first limit bytes
+    are scanned when limit is given. Safe to call from several threads; the
+    Hyperscan scan runs without the GIL.
+    """
+    if limit is None:
+        limit = len(content)
+    db = hyperscan_db()
+    if db is not None:
+        hits = set()
+        with memoryview(content) as view, view[:limit] as head:
+            db.scan(
+                head,
+                match_event_handler=lambda pattern_id, start, end, flags, context: hits.add(pattern_id),
+                scratch=_hyperscan_scratch(db),
+            )
+    else:
+        # One C-level substring search per literal picks the candidate
+        # patterns; only those run their regex
+        head = content[:limit].lower()
+        candidates = {
+            i for literal, indexes in ERROR_PATTERNS_BY_LITERAL.items() if literal in head for i in indexes
+        }
+        hits = {i for i in candidates if COMPILED_ERROR_PATTERNS[i][0].search(content, 0, limit)}
+    return [ERROR_PATTERNS[i][1] for i in sorted(hits)]
 
 # Minimum content thresholds
 MIN_HTML_SIZE = 500  # bytes - anything smaller is suspect
 MIN_VALID_HTML_SIZE = 2000  # bytes - minimum for a real page with content
 MAX_ERROR_PATTERN_MATCHES = 3  # More than this = likely an error page
+HTML_READ_BYTES = 50000  # Only the head of each file is scanned for error patterns
+MIN_FILES_FOR_PROCESS_POOL = 256  # Below this, pool startup costs more than it saves
+HTML_SUFFIXES = ('.html', '.html.gz')
+HTML_READ_THREADS = 32  # Threads reading/scanning HTML when sampling without the process pool
+URLS_STREAM_MIN_BYTES = 1 << 20  # urls.json at least this big is counted with ijson, not loaded
+
+
+def count_json_urls(path: Path) -> int:
+    """
+    Count the URLs in a urls.json file without loading it (requires ijson).
+
+    Handles both layouts _validate_urls accepts: a top-level list, or an
+    object with a 'urls' list. Items are parsed one at a time, so memory
+    stays flat however many URLs the file holds.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(4096).lstrip()
+        f.seek(0)
+        prefix = 'item' if head.startswith(b'[') else 'urls.item'
+        return sum(1 for _ in ijson.items(f, prefix))
+
+
+def gzip_uncompressed_size(path: str) -> int:
+    """Uncompressed size of a gzip file, read from its ISIZE trailer."""
+    with open(path, 'rb') as f:
+        if f.seek(0, os.SEEK_END) < 18:  # Shorter than an empty gzip member
+            return 0
+        f.seek(-4, os.SEEK_END)
+        return int.from_bytes(f.read(4), 'little')
+
+
+# File categories counted by DataAuditor._scan_files, in SourceAudit field order
+FILE_KINDS = ('html', 'json', 'jsonl', 'python', 'other')
+FILE_KIND_BY_SUFFIX = {'.html': 0, '.json': 1, '.jsonl': 2, '.py': 3}
+
+
+# Tooling/cache directories that never hold scraped data; not walked or audited
+SKIP_DIRS = frozenset({'.git', '__pycache__', 'node_modules', '.cache', 'logs'})
+
+
+def walk_files(path: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield a DirEntry for every regular file under path.
+
+    Symlinks are not followed and SKIP_DIRS subtrees are pruned.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+@lru_cache(maxsize=2**16)
+def classify_file_suffixes(suffixes: str) -> int:
+    """
+    Map a file's last two suffixes (e.g. '.html', '.html.gz') to a FILE_KINDS index.
+
+    Only a handful of distinct suffixes occur, so the cache turns per-file
+    classification into a single lookup.
+    """
+    suffixes = suffixes.lower()
+    if suffixes.endswith('.html.gz'):
+        return 0
+    return FILE_KIND_BY_SUFFIX.get(suffixes[suffixes.rfind('.'):], 4)
+
+
+def advise_sequential(fd: int):
+    """Tell the kernel fd will be read start to end: wider readahead, prefetch now (no-op without posix_fadvise)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass  # Advice only; e.g. pipes and some filesystems reject it
+
+
+def prefetch_html_heads(paths: list):
+    """Ask the kernel to start reading the head of each file (no-op without posix_fadvise)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, HTML_READ_BYTES, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def read_html_head(path: str) -> dict:
+    """
+    Read one HTML file's size and first HTML_READ_BYTES bytes.
+
+    The I/O half of scan_html_head: the result has audit_html_file's keys
+    plus 'head' (None if the file was empty or unreadable), with 'errors'
+    left unset.
+    """
+    result = {'path': path, 'size': None, 'head': None, 'errors': None, 'exception': None}
+    try:
+        if path.endswith('.gz'):
+            size = gzip_uncompressed_size(path)
+            result['size'] = size
+            if size:
+                with gzip.open(path, 'rb') as f:
+                    result['head'] = f.read(HTML_READ_BYTES)
+            return result
+
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            result['size'] = size
+            if size:
+                result['head'] = os.read(fd, HTML_READ_BYTES)
+        finally:
+            os.close(fd)
+    except Exception as e:
+        result['exception'] = str(e)
+    return result
+
+
+def scan_html_head(path: str) -> dict:
+    """
+    Thread-safe audit_html_file: read_html_head, then match the head.
+
+    Reads and Hyperscan scans both release the GIL, so a thread pool
+    overlaps them across files. Returns the same dict as audit_html_file.
+    """
+    result = read_html_head(path)
+    head = result.pop('head')
+    if head is not None:
+        result['errors'] = find_error_types(head)
+    return result
+
+
+def audit_html_file(path: str) -> dict:
+    """
+    Check one HTML file's size and error patterns.
+
+    Module-level so ProcessPoolExecutor workers can run it. Returns the file
+    size (None if stat failed), the matched error types (None if the file was
+    empty or unreadable) and the exception message on failure. Gzipped
+    (.html.gz) files report their uncompressed size.
+    """
+    result = {'path': path, 'size': None, 'errors': None, 'exception': None}
+    try:
+        if path.endswith('.gz'):
+            size = gzip_uncompressed_size(path)
+            result['size'] = size
+            if size == 0:
+                return result
+            # Only the head is decompressed
+            with gzip.open(path, 'rb') as f:
+                head = f.read(HTML_READ_BYTES)
+            result['errors'] = find_error_types(head)
+            return result
+
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            result['size'] = size
+            if size == 0:
+                return result
+            # Patterns are matched as bytes against the mapped file: no decode, no copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                result['errors'] = find_error_types(mm, HTML_READ_BYTES)
+    except Exception as e:
+        result['exception'] = str(e)
+    return result
 
 
 # ============================================================================
 # Build Validation
 # ============================================================================
 
-# Known car makes for validation
-KNOWN_MAKES = {
+# Known car makes for validation (lowercase, matched against normalize_label)
+KNOWN_MAKES = frozenset({
     'acura', 'alfa romeo', 'amc', 'aston martin', 'audi', 'bentley', 'bmw',
     'bugatti', 'buick', 'cadillac', 'chevrolet', 'chevy', 'chrysler', 'citroen',
     'datsun', 'dodge', 'ferrari', 'fiat', 'ford', 'genesis', 'gmc', 'honda',
@@ -111,12 +410,37 @@ KNOWN_MAKES = {
     'saab', 'saturn', 'scion', 'seat', 'shelby', 'skoda', 'smart', 'subaru',
     'suzuki', 'tesla', 'toyota', 'triumph', 'vauxhall', 'volkswagen', 'vw',
     'volvo', 'willys'
-}
+})
 
 # Year validation
 MIN_VALID_YEAR = 1900
 MAX_VALID_YEAR = 2027
 
+
+def intern_if_str(value):
+    """sys.intern value if it is a str, so repeated labels share one object; else return it as is."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@lru_cache(maxsize=4096)
+def normalize_label(value: str) -> str:
+    """
+    Lowercase and strip a make/category for KNOWN_MAKES/VALID_CATEGORIES lookups.
+
+    The same few labels repeat across every build and mod, so the cache
+    turns normalization into a single lookup.
+    """
+    return value.lower().strip()
+
+
+def parse_year(year) -> Optional[int]:
+    """Leading four characters of a year value as an int, or None if not numeric."""
+    try:
+        return int(str(year)[:4])
+    except (ValueError, TypeError):
+        return None
+
+
 # Garbage patterns in text fields
 GARBAGE_PATTERNS = [
     r'^(null|none|undefined|n/a|na|tbd|test|xxx|asdf)$',
@@ -126,29 +450,62 @@ GARBAGE_PATTERNS = [
     r'placeholder',
     r'^(string|object|array|error)$',
 ]
-COMPILED_GARBAGE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in GARBAGE_PATTERNS]
+# All garbage patterns as one alternation, so each check is a single match call
+GARBAGE_PATTERN_UNION = re.compile('|'.join(f'(?:{p})' for p in GARBAGE_PATTERNS), re.IGNORECASE)
+
+
+def is_garbage(value) -> bool:
+    """Check if a value is garbage/placeholder."""
+    return not value or GARBAGE_PATTERN_UNION.match(str(value).strip()) is not None
+
+
+# Field weights for BuildValidation.completeness_score. Read-only: the sum,
+# counter getter and weight vector below are derived from it once at import.
+BUILD_FIELD_WEIGHTS = MappingProxyType({
+    'build_id': 1.0,
+    'url': 1.0,
+    'make': 1.0,
+    'model': 1.0,
+    'year': 0.5,
+    'title': 0.3,
+    'story': 0.3,
+    'images': 0.5,
+})
+BUILD_FIELD_WEIGHTS_SUM = sum(BUILD_FIELD_WEIGHTS.values())
+
+# BuildValidation counters for each weighted field, in BUILD_FIELD_WEIGHTS order
+BUILD_FIELD_COUNTS = attrgetter(*(f'with_{name}' for name in BUILD_FIELD_WEIGHTS))
+BUILD_FIELD_WEIGHT_VECTOR = tuple(BUILD_FIELD_WEIGHTS.values())
 
 
 # ============================================================================
 # Modification Validation
 # ============================================================================
 
-# Valid modification categories
-VALID_CATEGORIES = {
+# Valid modification categories (lowercase, matched against normalize_label)
+VALID_CATEGORIES = frozenset({
     'engine', 'suspension', 'wheels/tires', 'wheels', 'tires', 'exterior',
     'interior', 'exhaust', 'brakes', 'electrical', 'drivetrain', 'cooling',
     'body', 'lighting', 'performance', 'audio', 'intake', 'turbo',
     'supercharger', 'fuel', 'transmission', 'differential', 'steering',
     'safety', 'aero', 'aerodynamics', 'other', 'wheel', 'brake & wheel hub',
     'exhaust & emission'
-}
+})
+MAX_UNKNOWN_CATEGORIES = 50  # Distinct unknown categories kept for the report
 
 
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+# overall_quality cut-offs between consecutive SourceAudit health levels
+HEALTH_THRESHOLDS = (40, 60, 80)
+HEALTH_LEVELS = ("critical", "degraded", "warning", "healthy")
+
+INV_GIB = 1.0 / (1 << 30)  # bytes -> GiB; exact, since 2**-30 is a power of two
+EXAMPLE_SOURCES = 3  # Source names quoted per health status / pipeline stage in recommendations
+
+@dataclass(slots=True, eq=False, repr=False)
 class HTMLValidation:
     """Validation results for HTML files."""
     total_files: int = 0
@@ -160,10 +517,10 @@ class HTMLValidation:
     total_bytes: int = 0
 
     # Error type breakdown
-    error_types: dict = field(default_factory=lambda: defaultdict(int))
+    error_types: Counter = field(default_factory=Counter)
 
     # Sample bad files for reporting
-    sample_errors: list = field(default_factory=list)
+    sample_errors: deque = field(default_factory=partial(deque, maxlen=5))
 
     @property
     def valid_pct(self) -> float:
@@ -178,7 +535,7 @@ class HTMLValidation:
         return (self.error_pages / self.total_files) * 100
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class BuildValidation:
     """Validation results for build data."""
     total_builds: int = 0
@@ -199,9 +556,9 @@ class BuildValidation:
 
     # Issues
     duplicate_ids: int = 0
-    invalid_years: list = field(default_factory=list)
-    unknown_makes: list = field(default_factory=list)
-    garbage_fields: list = field(default_factory=list)
+    invalid_years: deque = field(default_factory=partial(deque, maxlen=5))
+    unknown_makes: deque = field(default_factory=partial(deque, maxlen=10))
+    garbage_fields: deque = field(default_factory=partial(deque, maxlen=5))
 
     # Linked HTML check
     builds_with_html: int = 0
@@ -210,34 +567,14 @@ class BuildValidation:
     @property
     def completeness_score(self) -> float:
         """Calculate field completeness score (0-100)."""
-        if self.total_builds == 0:
+        total = self.total_builds
+        if total == 0:
             return 0.0
+        score = sum(count / total * weight for count, weight in zip(BUILD_FIELD_COUNTS(self), BUILD_FIELD_WEIGHT_VECTOR))
+        return score / BUILD_FIELD_WEIGHTS_SUM * 100
 
-        weights = {
-            'build_id': 1.0,
-            'url': 1.0,
-            'make': 1.0,
-            'model': 1.0,
-            'year': 0.5,
-            'title': 0.3,
-            'story': 0.3,
-            'images': 0.5,
-        }
-
-        score = 0
-        score += (self.with_build_id / self.total_builds) * weights['build_id']
-        score += (self.with_url / self.total_builds) * weights['url']
-        score += (self.with_make / self.total_builds) * weights['make']
-        score += (self.with_model / self.total_builds) * weights['model']
-        score += (self.with_year / self.total_builds) * weights['year']
-        score += (self.with_title / self.total_builds) * weights['title']
-        score += (self.with_story / self.total_builds) * weights['story']
-        score += (self.with_images / self.total_builds) * weights['images']
 
-        return (score / sum(weights.values())) * 100
-
-
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ModValidation:
     """Validation results for modification data."""
     total_mods: int = 0
@@ -250,18 +587,37 @@ class ModValidation:
     with_valid_category: int = 0
 
     # Category distribution
-    categories: dict = field(default_factory=lambda: defaultdict(int))
+    categories: Counter = field(default_factory=Counter)
     unknown_categories: list = field(default_factory=list)
 
     # Issues
-    garbage_names: list = field(default_factory=list)
+    garbage_names: deque = field(default_factory=partial(deque, maxlen=5))
     duplicate_mods: int = 0
 
     # Link to builds
     orphan_mods: int = 0  # Mods without matching build_id
 
 
-@dataclass
+def _pipeline_stage(has_urls: bool, has_html: bool, has_builds: bool, has_mods: bool) -> str:
+    if has_builds and has_mods:
+        return "complete"
+    elif has_builds:
+        return "stage3_partial"
+    elif has_html:
+        return "stage2_complete"
+    elif has_urls:
+        return "stage1_complete"
+    else:
+        return "empty"
+
+
+# SourceAudit.pipeline_stage for every combination of the stage indicators,
+# indexed by has_urls | has_html << 1 | has_builds << 2 | has_mods << 3
+PIPELINE_STAGE_TABLE = tuple(
+    _pipeline_stage(bool(i & 1), bool(i & 2), bool(i & 4), bool(i & 8)) for i in range(16)
+)
+
+@dataclass(slots=True, eq=False, repr=False)
 class SourceAudit:
     """Complete audit results for a single source directory."""
     name: str
@@ -293,48 +649,40 @@ class SourceAudit:
     issues: list = field(default_factory=list)
     warnings: list = field(default_factory=list)
 
+    # Combined scores, set by finalize() once the audit is complete
+    overall_quality: float = 0.0
+    health_status: str = "unknown"
+
+    def __repr__(self) -> str:
+        return f"<SourceAudit {self.name} stage={self.pipeline_stage}>"
+
     @property
     def pipeline_stage(self) -> str:
-        if self.has_builds and self.has_mods:
-            return "complete"
-        elif self.has_builds:
-            return "stage3_partial"
-        elif self.has_html_dir and self.html_files > 0:
-            return "stage2_complete"
-        elif self.has_urls:
-            return "stage1_complete"
-        else:
-            return "empty"
+        return PIPELINE_STAGE_TABLE[
+            self.has_urls
+            | (bool(self.has_html_dir and self.html_files > 0) << 1)
+            | (self.has_builds << 2)
+            | (self.has_mods << 3)
+        ]
 
-    @property
-    def overall_quality(self) -> float:
-        """Combined quality score considering HTML, builds, and mods."""
-        scores = []
+    def finalize(self):
+        """Compute overall_quality (HTML, builds, and mods combined) and health_status."""
+        total = 0.0
+        count = 0
 
         if self.html_validation.total_files > 0:
-            scores.append(self.html_validation.valid_pct)
+            total += self.html_validation.valid_pct
+            count += 1
 
         if self.build_validation.total_builds > 0:
-            scores.append(self.build_validation.completeness_score)
+            total += self.build_validation.completeness_score
+            count += 1
 
-        if not scores:
-            return 0.0
-        return sum(scores) / len(scores)
+        self.overall_quality = total / count if count else 0.0
+        self.health_status = HEALTH_LEVELS[bisect_right(HEALTH_THRESHOLDS, self.overall_quality)]
 
-    @property
-    def health_status(self) -> str:
-        """Overall health status."""
-        if self.overall_quality >= 80:
-            return "healthy"
-        elif self.overall_quality >= 60:
-            return "warning"
-        elif self.overall_quality >= 40:
-            return "degraded"
-        else:
-            return "critical"
 
-
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class AuditReport:
     """Complete audit report for the data directory."""
     timestamp: str
@@ -371,14 +719,250 @@ class AuditReport:
     total_warnings: int = 0
 
     # Error breakdown across all sources
-    html_error_types: dict = field(default_factory=lambda: defaultdict(int))
+    html_error_types: Counter = field(default_factory=Counter)
 
     # Detailed source audits
     sources: list = field(default_factory=list)
 
+    # First EXAMPLE_SOURCES (seq, name) pairs per health status and per
+    # pipeline stage, in audit order; filled by from_source_stream
+    _examples: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
     @property
     def total_gb(self) -> float:
-        return self.total_bytes / (1024 * 1024 * 1024)
+        return self.total_bytes * INV_GIB
+
+    def example_sources(self, *keys: str) -> list:
+        """Names of the first few audited sources whose health status or pipeline stage is in keys."""
+        pairs = sorted(chain.from_iterable(self._examples.get(key, ()) for key in keys))
+        return [name for _, name in pairs[:EXAMPLE_SOURCES]]
+
+    def __repr__(self) -> str:
+        return f"<AuditReport {self.data_dir} sources={len(self.sources)}>"
+
+    @classmethod
+    def from_source_stream(cls, audits: Iterable[SourceAudit], keep_worst: Optional[int] = None,
+                           **kwargs) -> 'AuditReport':
+        """
+        Build a report from a stream of source audits.
+
+        Each audit is folded into the summary as it arrives. All audits are kept
+        in sources unless keep_worst is set, in which case only the keep_worst
+        lowest-quality ones are (worst first) and the rest can be freed as the
+        stream advances.
+        """
+        r = cls(**kwargs)
+        rows = []
+        stages = Counter()
+        health = Counter()
+        html_valid_pcts = []
+        build_completeness_scores = []
+        worst = []  # Max-heap on quality: (-overall_quality, -seq, audit)
+
+        for seq, audit in enumerate(audits):
+            rows.append(SUMMARY_COUNTERS(audit))
+            r.html_error_types.update(audit.html_validation.error_types)
+            stage = audit.pipeline_stage
+            stages[stage] += 1
+            health[audit.health_status] += 1
+            for key in (stage, audit.health_status):
+                examples = r._examples.setdefault(key, [])
+                if len(examples) < EXAMPLE_SOURCES:
+                    examples.append((seq, audit.name))
+            r.total_issues += len(audit.issues)
+            r.total_warnings += len(audit.warnings)
+
+            if audit.html_validation.total_files > 0:
+                html_valid_pcts.append(audit.html_validation.valid_pct)
+            if audit.build_validation.total_builds > 0:
+                build_completeness_scores.append(audit.build_validation.completeness_score)
+
+            if keep_worst is None:
+                r.sources.append(audit)
+            elif keep_worst > 0:
+                heapq.heappush(worst, (-audit.overall_quality, -seq, audit))
+                if len(worst) > keep_worst:
+                    heapq.heappop(worst)
+
+        if keep_worst is not None:
+            r.sources = [audit for *_, audit in sorted(worst, reverse=True)]
+
+        r.total_sources = len(rows)
+        if not rows:
+            return r
+
+        # zip turns the per-source counter rows into columns, each summed in C
+        (r.total_html_files, r.total_valid_html, r.total_error_html, r.total_builds,
+         r.total_valid_builds, r.total_mods, r.total_bytes) = map(sum, zip(*rows))
+
+        # Pipeline stage counts
+        r.sources_empty = stages["empty"]
+        r.sources_stage1 = stages["stage1_complete"]
+        r.sources_stage2 = stages["stage2_started"] + stages["stage2_complete"]
+        r.sources_stage3 = stages["stage3_partial"]
+        r.sources_complete = stages["complete"]
+
+        # Health counts
+        r.sources_healthy = health["healthy"]
+        r.sources_warning = health["warning"]
+        r.sources_degraded = health["degraded"]
+        r.sources_critical = r.total_sources - r.sources_healthy - r.sources_warning - r.sources_degraded
+
+        # Calculate averages (mean of per-source percentages: fsum keeps it exact-rounded)
+        if html_valid_pcts:
+            r.avg_html_valid_pct = math.fsum(html_valid_pcts) / len(html_valid_pcts)
+        if build_completeness_scores:
+            r.avg_build_completeness = math.fsum(build_completeness_scores) / len(build_completeness_scores)
+
+        return r
+
+
+# Per-source counters summed into the AuditReport totals, in assignment order
+SUMMARY_COUNTERS = attrgetter(
+    'html_files',
+    'html_validation.valid_files',
+    'html_validation.error_pages',
+    'build_validation.total_builds',
+    'build_validation.valid_builds',
+    'mod_validation.total_mods',
+    'total_bytes',
+)
+
+
+def report_to_dict(obj):
+    """Like dataclasses.asdict(), but keeps Counters as plain dicts and skips private fields."""
+    if is_dataclass(obj):
+        return {f.name: report_to_dict(getattr(obj, f.name)) for f in fields(obj) if not f.name.startswith('_')}
+    if isinstance(obj, dict):
+        return {k: report_to_dict(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, deque)):
+        return [report_to_dict(v) for v in obj]
+    return obj
+
+
+def report_json_default(obj):
+    """
+    JSON default= hook that serializes report objects without a report_to_dict copy.
+
+    Deques become lists. Dataclasses (which orjson already handles natively)
+    become shallow dicts with private fields skipped, converted one object
+    at a time as the stdlib encoder reaches them, so a streamed dump never
+    holds a second copy of the whole report.
+    """
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj) if not f.name.startswith('_')}
+    if isinstance(obj, deque):
+        return list(obj)
+    return str(obj)
+
+
+def restore_dataclass(cls, data: dict):
+    """
+    Rebuild a dataclass from its report_to_dict() form.
+
+    Nested dataclass fields are rebuilt recursively, and Counter and deque
+    fields get their type (and deque maxlen) back from the field's factory.
+    """
+    kwargs = {}
+    for f in fields(cls):
+        if not f.init or f.name not in data:
+            continue
+        value = data[f.name]
+        if is_dataclass(f.type):
+            value = restore_dataclass(f.type, value)
+        elif f.default_factory is not MISSING:
+            template = f.default_factory()
+            if isinstance(template, deque):
+                value = deque(value, maxlen=template.maxlen)
+            elif isinstance(template, Counter):
+                value = Counter(value)
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
+
+def source_fingerprint(source_dir: Path) -> Optional[list]:
+    """
+    Fingerprint a source's files in one walk: [file count, total bytes, newest mtime_ns].
+
+    Adding, removing, resizing or touching any file changes it. Returns None
+    if the directory cannot be walked.
+    """
+    count = total = newest = 0
+    try:
+        for entry in walk_files(source_dir):
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            count += 1
+            total += st.st_size
+            if st.st_mtime_ns > newest:
+                newest = st.st_mtime_ns
+    except OSError:
+        return None
+    return [count, total, newest]
+
+
+class AuditCache:
+    """
+    Source audits from earlier runs, kept in one JSON file keyed by source path.
+
+    An entry is reused only while both the source's fingerprint and the audit
+    settings it was made with still match; otherwise the source is audited
+    again and the entry replaced.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.dirty = False
+        try:
+            with open(path, 'rb') as f:
+                entries = loads(f.read())
+        except (OSError, ValueError):
+            entries = None
+        self.entries: dict = entries if isinstance(entries, dict) else {}
+
+    def get(self, source_dir: Path, fingerprint: Optional[list], settings: list) -> Optional[SourceAudit]:
+        """The cached audit of source_dir, or None if missing or stale."""
+        entry = self.entries.get(str(source_dir))
+        if (fingerprint is None or not isinstance(entry, dict)
+                or entry.get('fingerprint') != fingerprint or entry.get('settings') != settings):
+            return None
+        try:
+            return restore_dataclass(SourceAudit, entry['audit'])
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, source_dir: Path, fingerprint: Optional[list], settings: list, audit: SourceAudit):
+        if fingerprint is None:
+            return
+        self.entries[str(source_dir)] = {
+            'fingerprint': fingerprint,
+            'settings': settings,
+            'audit': report_to_dict(audit),
+        }
+        self.dirty = True
+
+    def save(self):
+        """Write the cache back if it changed, replacing the old file atomically."""
+        if not self.dirty:
+            return
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(dumps(self.entries))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def audit_source_dir(source_dir: Path, verbose: bool, deep: bool, sample_size: int) -> SourceAudit:
+    """
+    Audit one source directory in a fresh single-process DataAuditor.
+
+    Module-level so ProcessPoolExecutor workers can run it.
+    """
+    auditor = DataAuditor(source_dir.parent, verbose=verbose, deep=deep,
+                          sample_size=sample_size, workers=1)
+    return auditor.audit_source(source_dir)
 
 
 # ============================================================================
@@ -389,11 +973,18 @@ class DataAuditor:
     """Audits the Ralph data directory for content quality and integrity."""
 
     def __init__(self, data_dir: Path, verbose: bool = False, deep: bool = False,
-                 sample_size: int = 100):
+                 sample_size: int = 100, workers: Optional[int] = None,
+                 keep_worst: Optional[int] = None, cache: Optional[AuditCache] = None):
         self.data_dir = data_dir
         self.verbose = verbose
         self.deep = deep
         self.sample_size = sample_size  # Number of files to sample for deep scan
+        self.workers = workers or os.cpu_count() or 1  # Processes for sources / large HTML samples
+        self.keep_worst = keep_worst  # Keep only this many lowest-quality sources (None = all)
+        self.cache = cache  # Audits of unchanged sources from earlier runs (None = always audit)
+        # Parsed builds/mods of the source being audited, cleared after each source
+        self._builds_cache: dict[Path, list] = {}
+        self._mods_cache: dict[Path, list] = {}
         self.report = AuditReport(
             timestamp=datetime.now().isoformat(),
             data_dir=str(data_dir),
@@ -420,6 +1011,7 @@ class DataAuditor:
 
         if not source_dir.is_dir():
             audit.issues.append(f"Not a directory: {source_dir}")
+            audit.finalize()
             return audit
 
         # Basic file scanning
@@ -429,42 +1021,50 @@ class DataAuditor:
 
         # Deep content validation
         if self.deep or self.verbose:
-            self._validate_html_content(source_dir, audit)
-            self._validate_builds_deep(source_dir, audit)
-            self._validate_mods_deep(source_dir, audit)
-            self._cross_validate(source_dir, audit)
-
+            try:
+                self._validate_html_content(source_dir, audit)
+                self._validate_builds_deep(source_dir, audit)
+                self._validate_mods_deep(source_dir, audit)
+                self._cross_validate(source_dir, audit)
+            finally:
+                self._builds_cache.clear()
+                self._mods_cache.clear()
+
+        audit.finalize()
         return audit
 
     def _scan_files(self, source_dir: Path, audit: SourceAudit):
         """Scan and categorize all files."""
-        for item in source_dir.rglob('*'):
-            if item.is_file():
-                try:
-                    size = item.stat().st_size
-                except OSError:
-                    continue
-
-                audit.total_bytes += size
-                suffix = item.suffix.lower()
+        counts = [0] * len(FILE_KINDS)
+        for entry in walk_files(source_dir):
+            try:
+                size = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+
+            audit.total_bytes += size
+            # Last two suffixes of the name, as Path.suffixes[-2:] would give
+            name = entry.name
+            dot = name.rfind('.')
+            if dot > 0:
+                prev = name.rfind('.', 1, dot)
+                counts[classify_file_suffixes(name[prev if prev > 0 else dot:])] += 1
+            else:
+                counts[-1] += 1
 
-                if suffix == '.html':
-                    audit.html_files += 1
-                elif suffix == '.json':
-                    audit.json_files += 1
-                elif suffix == '.jsonl':
-                    audit.jsonl_files += 1
-                elif suffix == '.py':
-                    audit.python_files += 1
-                else:
-                    audit.other_files += 1
+        (audit.html_files, audit.json_files, audit.jsonl_files,
+         audit.python_files, audit.other_files) = counts
 
     def _check_pipeline_files(self, source_dir: Path, audit: SourceAudit):
         """Check for presence of pipeline stage files."""
-        audit.has_urls = (source_dir / 'urls.json').exists() or (source_dir / 'urls.jsonl').exists()
-        audit.has_html_dir = (source_dir / 'html').is_dir()
-        audit.has_builds = (source_dir / 'builds.json').exists() or (source_dir / 'builds.jsonl').exists()
-        audit.has_mods = (source_dir / 'mods.json').exists() or (source_dir / 'mods.jsonl').exists()
+        # One listing instead of a stat per candidate file
+        with os.scandir(source_dir) as entries:
+            found = {entry.name: entry for entry in entries}
+        html_entry = found.get('html')
+        audit.has_urls = 'urls.json' in found or 'urls.jsonl' in found
+        audit.has_html_dir = html_entry is not None and html_entry.is_dir()
+        audit.has_builds = 'builds.json' in found or 'builds.jsonl' in found
+        audit.has_mods = 'mods.json' in found or 'mods.jsonl' in found
 
     def _validate_urls(self, source_dir: Path, audit: SourceAudit):
         """Validate URL files."""
@@ -473,8 +1073,12 @@ class DataAuditor:
             return
 
         try:
-            with open(urls_file, 'r') as f:
-                data = json.load(f)
+            if IJSON_AVAILABLE and urls_file.stat().st_size >= URLS_STREAM_MIN_BYTES:
+                audit.url_count = count_json_urls(urls_file)
+                return
+
+            with open(urls_file, 'rb') as f:
+                data = loads(f.read())
 
             if isinstance(data, dict) and 'urls' in data:
                 urls = data['urls']
@@ -494,23 +1098,31 @@ class DataAuditor:
         if not html_dir.is_dir():
             return
 
-        html_files = list(html_dir.glob('*.html'))
-        audit.html_validation.total_files = len(html_files)
-
-        # Sample files if there are too many
-        if len(html_files) > self.sample_size:
-            sampled_files = random.sample(html_files, self.sample_size)
-            is_sampled = True
-        else:
-            sampled_files = html_files
-            is_sampled = False
+        # Stream the directory into a fixed-size sample instead of listing it
+        with os.scandir(html_dir) as entries:
+            total_files, paths = reservoir_sample(
+                (entry.path for entry in entries if entry.name.endswith(HTML_SUFFIXES)),
+                self.sample_size
+            )
+        audit.html_validation.total_files = total_files
+        is_sampled = total_files > len(paths)
 
         valid_count = 0
         error_count = 0
 
-        for html_file in sampled_files:
-            try:
-                size = html_file.stat().st_size
+        prefetch_html_heads(paths)
+        if self.workers > 1 and len(paths) >= MIN_FILES_FOR_PROCESS_POOL:
+            hyperscan_db()  # Compile before forking so workers inherit it
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=hyperscan_db) as executor:
+                results = list(executor.map(audit_html_file, paths, chunksize=32))
+        else:
+            # Overlap reads and scans in threads; bookkeeping stays on this thread
+            with ThreadPoolExecutor(max_workers=min(HTML_READ_THREADS, len(paths) or 1)) as executor:
+                results = list(executor.map(scan_html_head, paths))
+
+        for result in results:
+            size = result['size']
+            if size is not None:
                 audit.html_validation.total_bytes += size
 
                 # Size checks
@@ -523,38 +1135,34 @@ class DataAuditor:
                 elif size < MIN_VALID_HTML_SIZE:
                     audit.html_validation.small_files += 1
 
-                # Content check
-                with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read(50000)  # Read first 50KB for pattern matching
-
-                # Check for error patterns
-                error_matches = []
-                for pattern, error_type in COMPILED_ERROR_PATTERNS:
-                    if pattern.search(content):
-                        error_matches.append(error_type)
-                        audit.html_validation.error_types[error_type] += 1
-
-                # Determine if this is an error page
-                if len(error_matches) >= MAX_ERROR_PATTERN_MATCHES:
-                    audit.html_validation.error_pages += 1
-                    error_count += 1
-
-                    # Store sample for reporting
-                    if len(audit.html_validation.sample_errors) < 5:
-                        audit.html_validation.sample_errors.append({
-                            'file': html_file.name,
-                            'size': size,
-                            'errors': error_matches[:5]
-                        })
-                else:
-                    valid_count += 1
-
-            except Exception as e:
-                self.log(f"Error reading {html_file.name}: {e}", "error")
+            if result['exception'] is not None:
+                self.log(f"Error reading {Path(result['path']).name}: {result['exception']}", "error")
+                continue
+
+            # Check for error patterns
+            error_matches = result['errors']
+            for error_type in error_matches:
+                audit.html_validation.error_types[error_type] += 1
+
+            # Determine if this is an error page
+            if len(error_matches) >= MAX_ERROR_PATTERN_MATCHES:
+                audit.html_validation.error_pages += 1
+                error_count += 1
+
+                # Store sample for reporting
+                sample_errors = audit.html_validation.sample_errors
+                if len(sample_errors) < sample_errors.maxlen:
+                    sample_errors.append({
+                        'file': Path(result['path']).name,
+                        'size': size,
+                        'errors': error_matches[:5]
+                    })
+            else:
+                valid_count += 1
 
         # Extrapolate if sampled
         if is_sampled:
-            ratio = len(html_files) / len(sampled_files)
+            ratio = total_files / len(paths)
             audit.html_validation.valid_files = int(valid_count * ratio)
             audit.html_validation.error_pages = int(error_count * ratio)
             audit.html_validation.empty_files = int(audit.html_validation.empty_files * ratio)
@@ -586,80 +1194,67 @@ class DataAuditor:
             return
 
         audit.build_validation.total_builds = len(builds)
-        seen_ids = set()
         html_dir = source_dir / 'html'
+        bv = audit.build_validation
+        # Locals for the per-field passes below (LOAD_FAST instead of LOAD_GLOBAL)
+        _is_garbage = is_garbage
+        _intern = intern_if_str
+        _normalize = normalize_label
+        _known_makes = KNOWN_MAKES
+        min_year, max_year = MIN_VALID_YEAR, MAX_VALID_YEAR
+
+        # Check build_id: one hash per build, duplicates counted per distinct ID
+        id_counts = Counter(bid for bid in (b.get('build_id') for b in builds) if bid)
+        bv.with_build_id = sum(id_counts.values())
+        bv.duplicate_ids = bv.with_build_id - len(id_counts)
+
+        # Check if HTML file exists: one directory listing instead of a stat per ID
+        if html_dir.is_dir():
+            with os.scandir(html_dir) as entries:
+                html_stems = {
+                    name[:-len(suffix)]
+                    for name in (entry.name for entry in entries)
+                    for suffix in HTML_SUFFIXES if name.endswith(suffix)
+                }
+            bv.builds_with_html = sum(count for bid, count in id_counts.items() if f"{bid}" in html_stems)
+            bv.builds_missing_html = bv.with_build_id - bv.builds_with_html
+
+        # Field checks run column by column: one tight pass per field
+
+        bv.with_url = sum(
+            1 for b in builds
+            if isinstance(url := b.get('source_url') or b.get('url'), str) and url.startswith('http')
+        )
+
+        years = [year for year in (b.get('year') for b in builds) if year]
+        year_ints = list(map(parse_year, years))
+        bv.with_year = len(years)
+        bv.with_valid_year = sum(1 for y in year_ints if y is not None and min_year <= y <= max_year)
+        # Keep the first invalid years only, without scanning past them
+        bv.invalid_years.extend(islice(
+            (year for year, y in zip(years, year_ints) if y is None or not min_year <= y <= max_year),
+            bv.invalid_years.maxlen - len(bv.invalid_years),
+        ))
+
+        # Low-cardinality: share one string object per distinct make
+        makes = [
+            _intern(make)
+            for make in (b.get('make') for b in builds)
+            if make and not _is_garbage(make)
+        ]
+        is_known = {make: _normalize(make) in _known_makes for make in set(makes)}
+        bv.with_make = len(makes)
+        bv.with_known_make = sum(map(is_known.__getitem__, makes))
+        bv.unknown_makes.extend(islice(
+            (make for make in makes if not is_known[make]),
+            bv.unknown_makes.maxlen - len(bv.unknown_makes),
+        ))
 
-        for build in builds:
-            # Check build_id
-            bid = build.get('build_id')
-            if bid:
-                audit.build_validation.with_build_id += 1
-                if bid in seen_ids:
-                    audit.build_validation.duplicate_ids += 1
-                seen_ids.add(bid)
-
-                # Check if HTML file exists
-                if html_dir.is_dir():
-                    html_file = html_dir / f"{bid}.html"
-                    if html_file.exists():
-                        audit.build_validation.builds_with_html += 1
-                    else:
-                        audit.build_validation.builds_missing_html += 1
-
-            # Check URL
-            url = build.get('source_url') or build.get('url')
-            if url and isinstance(url, str) and url.startswith('http'):
-                audit.build_validation.with_url += 1
-
-            # Check year
-            year = build.get('year')
-            if year:
-                audit.build_validation.with_year += 1
-                try:
-                    year_int = int(str(year)[:4])
-                    if MIN_VALID_YEAR <= year_int <= MAX_VALID_YEAR:
-                        audit.build_validation.with_valid_year += 1
-                    else:
-                        if len(audit.build_validation.invalid_years) < 5:
-                            audit.build_validation.invalid_years.append(year)
-                except (ValueError, TypeError):
-                    if len(audit.build_validation.invalid_years) < 5:
-                        audit.build_validation.invalid_years.append(year)
-
-            # Check make
-            make = build.get('make')
-            if make and not self._is_garbage(make):
-                audit.build_validation.with_make += 1
-                if make.lower().strip() in KNOWN_MAKES:
-                    audit.build_validation.with_known_make += 1
-                else:
-                    if len(audit.build_validation.unknown_makes) < 10:
-                        audit.build_validation.unknown_makes.append(make)
-
-            # Check model
-            model = build.get('model')
-            if model and not self._is_garbage(model):
-                audit.build_validation.with_model += 1
-
-            # Check title
-            title = build.get('build_title')
-            if title and not self._is_garbage(title):
-                audit.build_validation.with_title += 1
-
-            # Check story
-            story = build.get('build_story')
-            if story and len(str(story)) > 50:
-                audit.build_validation.with_story += 1
-
-            # Check images
-            images = build.get('gallery_images', [])
-            if images and len(images) > 0:
-                audit.build_validation.with_images += 1
-
-            # Check raw mods
-            mods_raw = build.get('modifications_raw', [])
-            if mods_raw and len(mods_raw) > 0:
-                audit.build_validation.with_mods_raw += 1
+        bv.with_model = sum(1 for b in builds if (model := b.get('model')) and not _is_garbage(model))
+        bv.with_title = sum(1 for b in builds if (title := b.get('build_title')) and not _is_garbage(title))
+        bv.with_story = sum(1 for b in builds if (story := b.get('build_story')) and len(str(story)) > 50)
+        bv.with_images = sum(1 for b in builds if (images := b.get('gallery_images')) and len(images) > 0)
+        bv.with_mods_raw = sum(1 for b in builds if (mods_raw := b.get('modifications_raw')) and len(mods_raw) > 0)
 
         # Count valid builds (has required fields)
         audit.build_validation.valid_builds = min(
@@ -688,46 +1283,64 @@ class DataAuditor:
             return
 
         audit.mod_validation.total_mods = len(mods)
-        seen_mods = set()
+        mod_keys = []
         build_ids = self._get_build_ids(source_dir)
 
+        # Everything the per-mod loop touches is bound to a local (LOAD_FAST),
+        # and its counters are plain ints stored back once after the loop
+        mv = audit.mod_validation
+        _is_garbage = is_garbage
+        _intern = intern_if_str
+        _normalize = normalize_label
+        _valid_categories = VALID_CATEGORIES
+        _max_unknown = MAX_UNKNOWN_CATEGORIES
+        categories = mv.categories
+        garbage_names = mv.garbage_names
+        unknown = mv.unknown_categories
+        add_key = mod_keys.append
+        with_name = with_brand = with_category = with_valid_category = orphan_mods = 0
+
         for mod in mods:
             # Check name
-            name = mod.get('name')
-            if name and not self._is_garbage(name):
-                audit.mod_validation.with_name += 1
-            else:
-                if len(audit.mod_validation.garbage_names) < 5:
-                    audit.mod_validation.garbage_names.append(name)
+            name = _intern(mod.get('name'))
+            if name and not _is_garbage(name):
+                with_name += 1
+            elif len(garbage_names) < garbage_names.maxlen:
+                garbage_names.append(name)
 
             # Check brand
             brand = mod.get('brand')
-            if brand and not self._is_garbage(brand):
-                audit.mod_validation.with_brand += 1
+            if brand and not _is_garbage(brand):
+                with_brand += 1
 
             # Check category
-            category = mod.get('category')
+            # Low-cardinality Counter key: share one string object per distinct category
+            category = _intern(mod.get('category'))
             if category:
-                audit.mod_validation.with_category += 1
-                cat_lower = category.lower().strip()
-                audit.mod_validation.categories[category] += 1
-
-                if cat_lower in VALID_CATEGORIES:
-                    audit.mod_validation.with_valid_category += 1
-                else:
-                    if category not in audit.mod_validation.unknown_categories:
-                        audit.mod_validation.unknown_categories.append(category)
-
-            # Check for duplicates
-            mod_key = (mod.get('build_id'), name, category)
-            if mod_key in seen_mods:
-                audit.mod_validation.duplicate_mods += 1
-            seen_mods.add(mod_key)
+                with_category += 1
+                categories[category] += 1
+
+                if _normalize(category) in _valid_categories:
+                    with_valid_category += 1
+                elif len(unknown) < _max_unknown and category not in unknown:
+                    unknown.append(category)
+
+            # Duplicate key; interned strings hash once and compare by identity
+            bid = _intern(mod.get('build_id'))
+            add_key((bid, name, category))
 
             # Check orphan mods
-            bid = mod.get('build_id')
             if bid and build_ids and bid not in build_ids:
-                audit.mod_validation.orphan_mods += 1
+                orphan_mods += 1
+
+        mv.with_name = with_name
+        mv.with_brand = with_brand
+        mv.with_category = with_category
+        mv.with_valid_category = with_valid_category
+        mv.orphan_mods = orphan_mods
+
+        # Check for duplicates: every repeat of a key beyond its first
+        mv.duplicate_mods = len(mod_keys) - len(set(mod_keys))
 
         # Count valid mods
         audit.mod_validation.valid_mods = min(
@@ -769,7 +1382,9 @@ class DataAuditor:
                 )
 
     def _load_builds(self, source_dir: Path) -> list:
-        """Load builds from JSONL or JSON file."""
+        """Load builds from JSONL or JSON file (parsed once per audit_source)."""
+        if source_dir in self._builds_cache:
+            return self._builds_cache[source_dir]
         builds = []
 
         jsonl_file = source_dir / 'builds.jsonl'
@@ -777,18 +1392,20 @@ class DataAuditor:
 
         if jsonl_file.exists():
             try:
-                with open(jsonl_file, 'r') as f:
+                # Binary lines go straight to the parser, trailing newline and all
+                with open(jsonl_file, 'rb') as f:
+                    advise_sequential(f.fileno())
                     for line in f:
-                        line = line.strip()
-                        if line:
-                            builds.append(json.loads(line))
+                        if not line.isspace():
+                            builds.append(loads(line))
             except Exception:
                 pass
 
         elif json_file.exists():
             try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
+                with open(json_file, 'rb') as f:
+                    advise_sequential(f.fileno())
+                    data = loads(f.read())
                 if isinstance(data, dict) and 'builds' in data:
                     builds = data['builds']
                 elif isinstance(data, list):
@@ -796,10 +1413,13 @@ class DataAuditor:
             except Exception:
                 pass
 
+        self._builds_cache[source_dir] = builds
         return builds
 
     def _load_mods(self, source_dir: Path) -> list:
-        """Load modifications from JSONL or JSON file."""
+        """Load modifications from JSONL or JSON file (parsed once per audit_source)."""
+        if source_dir in self._mods_cache:
+            return self._mods_cache[source_dir]
         mods = []
 
         jsonl_file = source_dir / 'mods.jsonl'
@@ -807,18 +1427,20 @@ class DataAuditor:
 
         if jsonl_file.exists():
             try:
-                with open(jsonl_file, 'r') as f:
+                # Binary lines go straight to the parser, trailing newline and all
+                with open(jsonl_file, 'rb') as f:
+                    advise_sequential(f.fileno())
                     for line in f:
-                        line = line.strip()
-                        if line:
-                            mods.append(json.loads(line))
+                        if not line.isspace():
+                            mods.append(loads(line))
             except Exception:
                 pass
 
         elif json_file.exists():
             try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
+                with open(json_file, 'rb') as f:
+                    advise_sequential(f.fileno())
+                    data = loads(f.read())
                 if isinstance(data, dict) and 'mods' in data:
                     mods = data['mods']
                 elif isinstance(data, list):
@@ -826,22 +1448,12 @@ class DataAuditor:
             except Exception:
                 pass
 
+        self._mods_cache[source_dir] = mods
         return mods
 
     def _get_build_ids(self, source_dir: Path) -> set:
         """Get set of all build IDs."""
-        builds = self._load_builds(source_dir)
-        return {b.get('build_id') for b in builds if b.get('build_id')}
-
-    def _is_garbage(self, value: str) -> bool:
-        """Check if a value is garbage/placeholder."""
-        if not value:
-            return True
-        value_str = str(value).strip()
-        for pattern in COMPILED_GARBAGE_PATTERNS:
-            if pattern.match(value_str):
-                return True
-        return False
+        return {b.get('build_id') for b in self._load_builds(source_dir) if b.get('build_id')}
 
     def run_audit(self, source_filter: Optional[str] = None) -> AuditReport:
         """Run complete audit of the data directory."""
@@ -852,11 +1464,12 @@ class DataAuditor:
         print(f"{c('Deep Scan:', Colors.DIM)} {'Enabled' if self.deep else 'Disabled (use --deep)'}")
         print(f"{c('Timestamp:', Colors.DIM)} {self.report.timestamp}\n")
 
-        # Find all source directories
-        source_dirs = sorted([
-            d for d in self.data_dir.iterdir()
-            if d.is_dir() and not d.name.startswith('.')
-        ])
+        # Find all source directories (DirEntry.is_dir uses the d_type from the listing)
+        with os.scandir(self.data_dir) as entries:
+            source_dirs = sorted(
+                Path(entry.path) for entry in entries
+                if not entry.name.startswith('.') and entry.name not in SKIP_DIRS and entry.is_dir()
+            )
 
         if source_filter:
             source_dirs = [d for d in source_dirs if source_filter.lower() in d.name.lower()]
@@ -864,97 +1477,96 @@ class DataAuditor:
 
         print(c(f"Scanning {len(source_dirs)} source directories...\n", Colors.BLUE))
 
-        # Audit each source
-        html_valid_pcts = []
-        build_completeness_scores = []
-
-        for i, source_dir in enumerate(source_dirs):
-            if self.verbose:
-                print(f"  [{i+1}/{len(source_dirs)}] {source_dir.name}...", end=" ", flush=True)
-
-            audit = self.audit_source(source_dir)
-            self.report.sources.append(audit)
-
-            if self.verbose:
-                status = c("✓", Colors.GREEN) if audit.health_status in ("healthy", "warning") else c("!", Colors.YELLOW)
-                print(f"{status} {audit.overall_quality:.0f}%")
-
-            # Update summary stats
-            self.report.total_sources += 1
-            self.report.total_html_files += audit.html_files
-            self.report.total_valid_html += audit.html_validation.valid_files
-            self.report.total_error_html += audit.html_validation.error_pages
-            self.report.total_builds += audit.build_validation.total_builds
-            self.report.total_valid_builds += audit.build_validation.valid_builds
-            self.report.total_mods += audit.mod_validation.total_mods
-            self.report.total_bytes += audit.total_bytes
-
-            # Aggregate error types
-            for error_type, count in audit.html_validation.error_types.items():
-                self.report.html_error_types[error_type] += count
-
-            # Pipeline stage counts
-            stage = audit.pipeline_stage
-            if stage == "empty":
-                self.report.sources_empty += 1
-            elif stage == "stage1_complete":
-                self.report.sources_stage1 += 1
-            elif stage in ("stage2_started", "stage2_complete"):
-                self.report.sources_stage2 += 1
-            elif stage == "stage3_partial":
-                self.report.sources_stage3 += 1
-            elif stage == "complete":
-                self.report.sources_complete += 1
-
-            # Health counts
-            health = audit.health_status
-            if health == "healthy":
-                self.report.sources_healthy += 1
-            elif health == "warning":
-                self.report.sources_warning += 1
-            elif health == "degraded":
-                self.report.sources_degraded += 1
-            else:
-                self.report.sources_critical += 1
-
-            # Track issues
-            self.report.total_issues += len(audit.issues)
-            self.report.total_warnings += len(audit.warnings)
-
-            # Quality metrics
-            if audit.html_validation.total_files > 0:
-                html_valid_pcts.append(audit.html_validation.valid_pct)
-            if audit.build_validation.total_builds > 0:
-                build_completeness_scores.append(audit.build_validation.completeness_score)
+        # Audit each source, aggregating as the audits stream in
+        self.report = AuditReport.from_source_stream(
+            self._iter_audits(source_dirs),
+            keep_worst=self.keep_worst,
+            timestamp=self.report.timestamp,
+            data_dir=self.report.data_dir,
+            deep_scan=self.report.deep_scan,
+        )
+        if self.cache is not None:
+            self.cache.save()
+        return self.report
 
-        # Calculate averages
-        if html_valid_pcts:
-            self.report.avg_html_valid_pct = sum(html_valid_pcts) / len(html_valid_pcts)
-        if build_completeness_scores:
-            self.report.avg_build_completeness = sum(build_completeness_scores) / len(build_completeness_scores)
+    def _iter_audits(self, source_dirs: list) -> Iterator[SourceAudit]:
+        """
+        Audit each source directory, yielding SourceAudits in source_dirs order.
+
+        With several sources and workers, whole sources are audited in parallel
+        processes (each auditing its HTML sample serially); a single source
+        keeps the process pool for its HTML sample instead. With a cache, only
+        sources whose files or audit settings changed are audited.
+        """
+        cached = [None] * len(source_dirs)
+        if self.cache is not None:
+            settings = [bool(self.deep or self.verbose), self.sample_size]
+            fingerprints = list(map(source_fingerprint, source_dirs))
+            cached = [self.cache.get(d, fp, settings) for d, fp in zip(source_dirs, fingerprints)]
+        todo = [d for d, audit in zip(source_dirs, cached) if audit is None]
+
+        if self.workers > 1 and len(todo) > 1:
+            initializer = None
+            if self.deep or self.verbose:  # Workers will scan HTML
+                hyperscan_db()  # Compile before forking so workers inherit it
+                initializer = hyperscan_db
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.workers, len(todo)), initializer=initializer
+            )
+            audits = executor.map(
+                audit_source_dir, todo,
+                repeat(self.verbose), repeat(self.deep), repeat(self.sample_size)
+            )
+        else:
+            executor = None
+            audits = map(self.audit_source, todo)
 
-        return self.report
+        # One write per source; flush about 20 times over the run, not per line
+        flush_every = max(1, len(source_dirs) // 20)
+        try:
+            for i, source_dir in enumerate(source_dirs, 1):
+                audit = cached[i - 1]
+                from_cache = audit is not None
+                if not from_cache:
+                    audit = next(audits)
+                    if self.cache is not None:
+                        self.cache.put(source_dir, fingerprints[i - 1], settings, audit)
+
+                if self.verbose:
+                    status = c("✓", Colors.GREEN) if audit.health_status in ("healthy", "warning") else c("!", Colors.YELLOW)
+                    note = c(" (cached)", Colors.DIM) if from_cache else ""
+                    sys.stdout.write(
+                        f"  [{i}/{len(source_dirs)}] {source_dir.name}... {status} {audit.overall_quality:.0f}%{note}\n"
+                    )
+                    if i % flush_every == 0:
+                        sys.stdout.flush()
+
+                yield audit
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
     def print_summary(self):
         """Print a formatted summary of the audit results."""
         r = self.report
+        out = []  # Output lines, written to stdout in one call at the end
 
         # Overall stats
-        print(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.BLUE))
-        print(c("│                    SUMMARY STATISTICS                       │", Colors.BLUE))
-        print(c("└─────────────────────────────────────────────────────────────┘", Colors.BLUE))
+        out.append(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.BLUE))
+        out.append(c("│                    SUMMARY STATISTICS                       │", Colors.BLUE))
+        out.append(c("└─────────────────────────────────────────────────────────────┘", Colors.BLUE))
 
-        print(f"\n  {c('Total Sources:', Colors.BOLD)} {r.total_sources}")
-        print(f"  {c('Total Size:', Colors.BOLD)} {r.total_gb:.2f} GB")
-        print(f"  {c('Total HTML Files:', Colors.BOLD)} {r.total_html_files:,}")
-        print(f"  {c('Total Builds:', Colors.BOLD)} {r.total_builds:,}")
-        print(f"  {c('Total Modifications:', Colors.BOLD)} {r.total_mods:,}")
+        out.append(f"\n  {c('Total Sources:', Colors.BOLD)} {r.total_sources}")
+        out.append(f"  {c('Total Size:', Colors.BOLD)} {r.total_gb:.2f} GB")
+        out.append(f"  {c('Total HTML Files:', Colors.BOLD)} {r.total_html_files:,}")
+        out.append(f"  {c('Total Builds:', Colors.BOLD)} {r.total_builds:,}")
+        out.append(f"  {c('Total Modifications:', Colors.BOLD)} {r.total_mods:,}")
 
         # HTML Health
         if self.deep and r.total_html_files > 0:
-            print(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.CYAN))
-            print(c("│                    HTML CONTENT HEALTH                      │", Colors.CYAN))
-            print(c("└─────────────────────────────────────────────────────────────┘", Colors.CYAN))
+            out.append(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.CYAN))
+            out.append(c("│                    HTML CONTENT HEALTH                      │", Colors.CYAN))
+            out.append(c("└─────────────────────────────────────────────────────────────┘", Colors.CYAN))
 
             valid_pct = (r.total_valid_html / r.total_html_files * 100) if r.total_html_files else 0
             error_pct = (r.total_error_html / r.total_html_files * 100) if r.total_html_files else 0
@@ -962,36 +1574,36 @@ class DataAuditor:
             valid_color = Colors.GREEN if valid_pct >= 80 else (Colors.YELLOW if valid_pct >= 60 else Colors.RED)
             error_color = Colors.GREEN if error_pct < 10 else (Colors.YELLOW if error_pct < 30 else Colors.RED)
 
-            print(f"\n  {c('Valid HTML Files:', Colors.BOLD)} {r.total_valid_html:,} ({c(f'{valid_pct:.1f}%', valid_color)})")
-            print(f"  {c('Error Pages:', Colors.BOLD)} {r.total_error_html:,} ({c(f'{error_pct:.1f}%', error_color)})")
+            out.append(f"\n  {c('Valid HTML Files:', Colors.BOLD)} {r.total_valid_html:,} ({c(f'{valid_pct:.1f}%', valid_color)})")
+            out.append(f"  {c('Error Pages:', Colors.BOLD)} {r.total_error_html:,} ({c(f'{error_pct:.1f}%', error_color)})")
 
             # Error breakdown
             if r.html_error_types:
-                print(f"\n  {c('Error Types Detected:', Colors.BOLD)}")
+                out.append(f"\n  {c('Error Types Detected:', Colors.BOLD)}")
                 sorted_errors = sorted(r.html_error_types.items(), key=lambda x: x[1], reverse=True)
                 for error_type, count in sorted_errors[:8]:
                     bar_len = min(int(count / max(r.html_error_types.values()) * 20), 20)
                     bar = "█" * bar_len
-                    print(f"    {error_type:<20} {c(bar, Colors.RED)} {count:,}")
+                    out.append(f"    {error_type:<20} {c(bar, Colors.RED)} {count:,}")
 
         # Build Quality
         if self.deep and r.total_builds > 0:
-            print(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.GREEN))
-            print(c("│                    BUILD DATA QUALITY                       │", Colors.GREEN))
-            print(c("└─────────────────────────────────────────────────────────────┘", Colors.GREEN))
+            out.append(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.GREEN))
+            out.append(c("│                    BUILD DATA QUALITY                       │", Colors.GREEN))
+            out.append(c("└─────────────────────────────────────────────────────────────┘", Colors.GREEN))
 
             valid_pct = (r.total_valid_builds / r.total_builds * 100) if r.total_builds else 0
             completeness_color = Colors.GREEN if r.avg_build_completeness >= 80 else (
                 Colors.YELLOW if r.avg_build_completeness >= 60 else Colors.RED
             )
 
-            print(f"\n  {c('Valid Builds:', Colors.BOLD)} {r.total_valid_builds:,} / {r.total_builds:,} ({valid_pct:.1f}%)")
-            print(f"  {c('Avg Completeness:', Colors.BOLD)} {c(f'{r.avg_build_completeness:.1f}%', completeness_color)}")
+            out.append(f"\n  {c('Valid Builds:', Colors.BOLD)} {r.total_valid_builds:,} / {r.total_builds:,} ({valid_pct:.1f}%)")
+            out.append(f"  {c('Avg Completeness:', Colors.BOLD)} {c(f'{r.avg_build_completeness:.1f}%', completeness_color)}")
 
         # Health Status
-        print(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.HEADER))
-        print(c("│                    SOURCE HEALTH STATUS                     │", Colors.HEADER))
-        print(c("└─────────────────────────────────────────────────────────────┘", Colors.HEADER))
+        out.append(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.HEADER))
+        out.append(c("│                    SOURCE HEALTH STATUS                     │", Colors.HEADER))
+        out.append(c("└─────────────────────────────────────────────────────────────┘", Colors.HEADER))
 
         max_count = max(r.sources_healthy, r.sources_warning, r.sources_degraded, r.sources_critical, 1)
         bar_width = 25
@@ -1006,12 +1618,12 @@ class DataAuditor:
         for name, count, color in health_data:
             bar_len = int((count / max_count) * bar_width) if max_count > 0 else 0
             bar = "█" * bar_len + "░" * (bar_width - bar_len)
-            print(f"  {name:<22} {c(bar, color)} {count:3}")
+            out.append(f"  {name:<22} {c(bar, color)} {count:3}")
 
         # Pipeline status
-        print(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.CYAN))
-        print(c("│                    PIPELINE STATUS                          │", Colors.CYAN))
-        print(c("└─────────────────────────────────────────────────────────────┘", Colors.CYAN))
+        out.append(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.CYAN))
+        out.append(c("│                    PIPELINE STATUS                          │", Colors.CYAN))
+        out.append(c("└─────────────────────────────────────────────────────────────┘", Colors.CYAN))
 
         stages = [
             ("Empty", r.sources_empty, Colors.DIM),
@@ -1025,12 +1637,12 @@ class DataAuditor:
         for name, count, color in stages:
             bar_len = int((count / max_count) * bar_width) if max_count > 0 else 0
             bar = "█" * bar_len + "░" * (bar_width - bar_len)
-            print(f"  {name:<18} {c(bar, color)} {count:3}")
+            out.append(f"  {name:<18} {c(bar, color)} {count:3}")
 
         # Detailed source table
-        print(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.HEADER))
-        print(c("│                    SOURCE DETAILS                           │", Colors.HEADER))
-        print(c("└─────────────────────────────────────────────────────────────┘", Colors.HEADER))
+        out.append(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.HEADER))
+        out.append(c("│                    SOURCE DETAILS                           │", Colors.HEADER))
+        out.append(c("└─────────────────────────────────────────────────────────────┘", Colors.HEADER))
 
         # Sort by issues/health
         sorted_sources = sorted(r.sources, key=lambda s: (
@@ -1038,8 +1650,8 @@ class DataAuditor:
             s.overall_quality,
         ))
 
-        print(f"\n  {'Source':<22} {'HTML':<12} {'Builds':<12} {'Quality':>8} {'Status':<10}")
-        print(f"  {'-'*22} {'-'*12} {'-'*12} {'-'*8} {'-'*10}")
+        out.append(f"\n  {'Source':<22} {'HTML':<12} {'Builds':<12} {'Quality':>8} {'Status':<10}")
+        out.append(f"  {'-'*22} {'-'*12} {'-'*12} {'-'*8} {'-'*10}")
 
         for s in sorted_sources[:20]:
             html_info = f"{s.html_validation.valid_files}/{s.html_files}" if self.deep else str(s.html_files)
@@ -1059,30 +1671,31 @@ class DataAuditor:
                 "critical": "🔴"
             }.get(s.health_status, "⚪")
 
-            print(f"  {s.name:<22} {html_info:<12} {build_info:<12} {s.overall_quality:>6.0f}% {health_icon}")
+            out.append(f"  {s.name:<22} {html_info:<12} {build_info:<12} {s.overall_quality:>6.0f}% {health_icon}")
 
         # Critical issues
         critical_sources = [s for s in r.sources if s.issues]
         if critical_sources:
-            print(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.RED))
-            print(c("│                    CRITICAL ISSUES                          │", Colors.RED))
-            print(c("└─────────────────────────────────────────────────────────────┘", Colors.RED))
+            out.append(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.RED))
+            out.append(c("│                    CRITICAL ISSUES                          │", Colors.RED))
+            out.append(c("└─────────────────────────────────────────────────────────────┘", Colors.RED))
 
             for s in critical_sources[:10]:
-                print(f"\n  {c(s.name, Colors.BOLD)}")
+                out.append(f"\n  {c(s.name, Colors.BOLD)}")
                 for issue in s.issues:
-                    print(f"    {c('✗', Colors.RED)} {issue}")
+                    out.append(f"    {c('✗', Colors.RED)} {issue}")
 
         # Recommendations
-        print(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.CYAN))
-        print(c("│                    RECOMMENDATIONS                          │", Colors.CYAN))
-        print(c("└─────────────────────────────────────────────────────────────┘", Colors.CYAN))
+        out.append(c("\n┌─────────────────────────────────────────────────────────────┐", Colors.CYAN))
+        out.append(c("│                    RECOMMENDATIONS                          │", Colors.CYAN))
+        out.append(c("└─────────────────────────────────────────────────────────────┘", Colors.CYAN))
 
         recommendations = self._generate_recommendations()
         for i, rec in enumerate(recommendations, 1):
-            print(f"\n  {i}. {rec}")
+            out.append(f"\n  {i}. {rec}")
 
-        print()
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
 
     def _generate_recommendations(self) -> list:
         """Generate recommendations based on audit findings."""
@@ -1091,7 +1704,7 @@ class DataAuditor:
 
         # Critical health sources
         if r.sources_critical > 0:
-            critical_names = [s.name for s in r.sources if s.health_status == "critical"][:3]
+            critical_names = r.example_sources("critical")
             recommendations.append(
                 f"🔴 {c('URGENT:', Colors.RED)} {r.sources_critical} sources have critical data quality issues: "
                 f"{', '.join(critical_names)}{'...' if len(critical_names) < r.sources_critical else ''}"
@@ -1113,7 +1726,7 @@ class DataAuditor:
 
         # Stalled pipelines
         if r.sources_stage2 > 3:
-            stage2_names = [s.name for s in r.sources if s.pipeline_stage in ("stage2_started", "stage2_complete")][:3]
+            stage2_names = r.example_sources("stage2_started", "stage2_complete")
             recommendations.append(
                 f"📊 Run data extraction for {r.sources_stage2} sources: {', '.join(stage2_names)}..."
             )
@@ -1131,14 +1744,8 @@ class DataAuditor:
 
     def export_json(self, filepath: Path):
         """Export full audit report to JSON file."""
-        def convert(obj):
-            if isinstance(obj, defaultdict):
-                return dict(obj)
-            return str(obj)
-
-        report_dict = asdict(self.report)
-        with open(filepath, 'w') as f:
-            json.dump(report_dict, f, indent=2, default=convert)
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            dump_indented(self.report, f, default=report_json_default)
 
         print(c(f"\n✓ Report exported to: {filepath}", Colors.GREEN))
 
@@ -1184,6 +1791,24 @@ def main():
         type=Path,
         help='Export full report to JSON file'
     )
+    parser.add_argument(
+        '--keep-worst',
+        type=int,
+        metavar='N',
+        help='Keep details for only the N lowest-quality sources (bounds memory on large trees)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        metavar='N',
+        help='Worker processes for auditing sources in parallel (default: CPU count; 1 = sequential)'
+    )
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        metavar='PATH',
+        help='Reuse audits of unchanged sources from this JSON cache file (created if missing)'
+    )
 
     args = parser.parse_args()
 
@@ -1195,17 +1820,17 @@ def main():
         args.data_dir,
         verbose=args.verbose,
         deep=args.deep,
-        sample_size=args.sample_size
+        sample_size=args.sample_size,
+        workers=args.jobs,
+        keep_worst=args.keep_worst,
+        cache=AuditCache(args.cache) if args.cache else None
     )
 
     report = auditor.run_audit(source_filter=args.source)
 
     if args.json:
-        def convert(obj):
-            if isinstance(obj, defaultdict):
-                return dict(obj)
-            return str(obj)
-        print(json.dumps(asdict(report), indent=2, default=convert))
+        sys.stdout.flush()  # Banner text first, then the JSON bytes
+        dump_indented(report, sys.stdout.buffer, default=report_json_default)
     else:
         auditor.print_summary()
 
@@ -38,24 +38,27 @@ Exit codes:
 """
 
 import argparse
-import json
+import mmap
+import os
 import re
 import sys
-import random
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Set
+from typing import Dict, List, Tuple, Optional, Any, Set, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from urllib.parse import urlparse
 from collections import Counter
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from _fast_json import JSONDecodeError, dump_indented, loads
+from _sampling import reservoir_sample
 
 
 # ============================================================================
 # Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AuditIssue:
     """Represents a single audit issue."""
     severity: str  # "critical", "warning", "info"
@@ -67,8 +70,16 @@ class AuditIssue:
         icon = {"critical": "❌", "warning": "⚠️", "info": "ℹ️"}.get(self.severity, "•")
         return f"{icon} [{self.category}] {self.message}"
 
+    def to_dict(self) -> Dict:
+        return {
+            "severity": self.severity,
+            "category": self.category,
+            "message": self.message,
+            "details": self.details
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class AuditResult:
     """Complete audit result."""
     source_dir: Path
@@ -77,19 +88,35 @@ class AuditResult:
     passed: bool
     issues: List[AuditIssue] = field(default_factory=list)
     stats: Dict[str, Any] = field(default_factory=dict)
+    # Issues per severity, kept up to date by add_issue
+    _severity_counts: Counter = field(default_factory=Counter, repr=False, compare=False)
 
     @property
     def critical_count(self) -> int:
-        return sum(1 for i in self.issues if i.severity == "critical")
+        return self._severity_counts["critical"]
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for i in self.issues if i.severity == "warning")
+        return self._severity_counts["warning"]
 
     def add_issue(self, severity: str, category: str, message: str, details: Dict = None):
         self.issues.append(AuditIssue(severity, category, message, details))
-
-    def to_dict(self) -> Dict:
+        self._severity_counts[severity] += 1
+
+    def merge(self, other: 'AuditResult'):
+        """Append another result's issues and stats, as if its checks had run on this one."""
+        self.issues.extend(other.issues)
+        self._severity_counts.update(other._severity_counts)
+        self.stats.update(other.stats)
+
+    def to_dict(self, issue_objects: bool = False) -> Dict:
+        """
+        Return the result as a JSON-ready dict.
+
+        With issue_objects, "issues" is the list of AuditIssue instances itself
+        rather than a copy as dicts; serialize that form with
+        audit_json_default (orjson encodes the dataclasses natively).
+        """
         return {
             "source_dir": str(self.source_dir),
             "timestamp": self.timestamp,
@@ -101,33 +128,53 @@ class AuditResult:
                 "total_issues": len(self.issues)
             },
             "stats": self.stats,
-            "issues": [
-                {
-                    "severity": i.severity,
-                    "category": i.category,
-                    "message": i.message,
-                    "details": i.details
-                }
-                for i in self.issues
-            ]
+            "issues": self.issues if issue_objects else [i.to_dict() for i in self.issues]
         }
 
 
+@dataclass(slots=True)
+class AuditData:
+    """
+    A source's parsed extraction outputs, loaded once and shared by the audit phases.
+
+    builds/mods are None when the source has no builds/mods file at all, and
+    html_names is None when it has no html/ directory.
+    """
+    builds: Optional[List[Dict]] = None
+    mods: Optional[List[Dict]] = None
+    html_names: Optional[List[str]] = None  # *.html file names in html/, in listing order
+
+    @classmethod
+    def load(cls, source_dir: Path) -> 'AuditData':
+        return cls(
+            builds=load_builds(source_dir),
+            mods=load_mods(source_dir),
+            html_names=scan_html_names(source_dir / "html"),
+        )
+
+
+def audit_json_default(obj):
+    """JSON default= hook: AuditIssues as their dicts, anything else foreign as str."""
+    if isinstance(obj, AuditIssue):
+        return obj.to_dict()
+    return str(obj)
+
+
 # ============================================================================
 # Validation Constants
 # ============================================================================
 
-VALID_SOURCE_TYPES = {"listing", "auction", "build_thread", "project", "gallery", "article"}
+VALID_SOURCE_TYPES = frozenset({"listing", "auction", "build_thread", "project", "gallery", "article"})
 
-VALID_BUILD_TYPES = {
+VALID_BUILD_TYPES = frozenset({
     "OEM+", "Street", "Track", "Drift", "Rally", "Time Attack", "Drag", "Show",
     "Restomod", "Restoration", "Pro Touring", "Overland", "Off-Road", "Rock Crawler",
     "Prerunner", "Trophy Truck", "Lowrider", "Stance", "VIP", "Bosozoku", "Rat Rod",
     "Hot Rod", "Muscle", "Classic", "Modern Classic", "JDM", "Euro", "USDM",
     "Daily Driver", "Weekend Warrior", "Work Truck", "Tow Rig"
-}
+})
 
-VALID_MOD_CATEGORIES = {
+VALID_MOD_CATEGORIES = frozenset({
     "Forced Induction", "Oil", "Wheel", "Safety", "Lighting", "Storage",
     "Recovery", "Armor/Protection", "Suspension", "Fuel & Air",
     "Brake & Wheel Hub", "Engine", "Exhaust & Emission", "Interior",
@@ -135,21 +182,35 @@ VALID_MOD_CATEGORIES = {
     "Electrical", "Cooling System", "Body & Lamp Assembly", "Steering",
     "Heat & Air Conditioning", "Ignition", "Belt Drive", "Wiper & Washer",
     "Aero", "Other"
-}
+})
 
 # Year validation
 MIN_VALID_YEAR = 1885  # First automobile
 MAX_VALID_YEAR = datetime.now().year + 2  # Allow next model year
 
 # Common automotive makes for validation
-COMMON_MAKES = {
+COMMON_MAKES = frozenset({
     "ford", "chevrolet", "chevy", "toyota", "honda", "bmw", "mercedes", "audi",
     "porsche", "volkswagen", "vw", "nissan", "mazda", "subaru", "mitsubishi",
     "lexus", "acura", "infiniti", "dodge", "jeep", "chrysler", "ram", "gmc",
     "cadillac", "buick", "lincoln", "tesla", "hyundai", "kia", "volvo", "jaguar",
     "land rover", "ferrari", "lamborghini", "mclaren", "aston martin", "bentley",
     "rolls royce", "alfa romeo", "fiat", "mini", "saab", "lotus", "maserati"
-}
+})
+
+# Fields every extracted build must have (non-empty)
+REQUIRED_BUILD_FIELDS = ("build_id", "source_url", "year", "make", "model")
+
+# Patterns for placeholder/broken images
+PLACEHOLDER_IMAGE_PATTERNS = [
+    r'placeholder', r'no-image', r'noimage', r'default', r'missing',
+    r'blank\.', r'1x1\.', r'spacer', r'transparent'
+]
+PLACEHOLDER_IMAGE_RE = re.compile('|'.join(PLACEHOLDER_IMAGE_PATTERNS), re.IGNORECASE)
+
+# A scheme, "://" and a non-empty host: a match means urlparse() would report
+# both scheme and netloc, so only non-matching URLs need the full parser
+ABSOLUTE_URL_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*://[^/?#\t\r\n]')
 
 
 # ============================================================================
@@ -161,29 +222,106 @@ def load_json_file(filepath: Path) -> Optional[Any]:
     if not filepath.exists():
         return None
     try:
-        with open(filepath) as f:
-            return json.load(f)
-    except json.JSONDecodeError:
+        with open(filepath, 'rb') as f:
+            return loads(f.read())
+    except JSONDecodeError:
         return None
 
 
-def load_jsonl_file(filepath: Path) -> List[Dict]:
-    """Load a JSONL file."""
-    if not filepath.exists():
+def load_builds_json(filepath: Path) -> List[Dict]:
+    """
+    Load the build list from a builds.json file ({"builds": [...]} or a bare list).
+
+    Returns [] if the file is unparseable or holds no build list.
+    """
+    data = load_json_file(filepath)
+    if not data:
         return []
-    records = []
-    with open(filepath) as f:
+    builds = data.get("builds", data) if isinstance(data, dict) else data
+    return builds if isinstance(builds, list) else []
+
+
+def iter_jsonl_file(filepath: Path) -> Iterator[Any]:
+    """Yield the records of a JSONL file one at a time, skipping malformed lines."""
+    if not filepath.exists():
+        return
+    with open(filepath, 'rb') as f:
         for line in f:
             line = line.strip()
             if line:
                 try:
-                    records.append(json.loads(line))
-                except json.JSONDecodeError:
+                    yield loads(line)
+                except JSONDecodeError:
                     continue
-    return records
 
 
-def audit_pipeline_completeness(source_dir: Path, result: AuditResult):
+def load_jsonl_file(filepath: Path) -> List[Dict]:
+    """Load a JSONL file."""
+    return list(iter_jsonl_file(filepath))
+
+
+def load_builds(source_dir: Path) -> Optional[List[Dict]]:
+    """Load a source's builds from builds.json, else builds.jsonl; None if it has neither."""
+    builds_json = source_dir / "builds.json"
+    builds_jsonl = source_dir / "builds.jsonl"
+
+    if builds_json.exists():
+        return load_builds_json(builds_json)
+    elif builds_jsonl.exists():
+        return load_jsonl_file(builds_jsonl)
+    return None
+
+
+def load_mods(source_dir: Path) -> Optional[List[Dict]]:
+    """Load a source's standalone mods from mods.json, else mods.jsonl; None if it has neither."""
+    mods_json = source_dir / "mods.json"
+    mods_jsonl = source_dir / "mods.jsonl"
+
+    if mods_json.exists():
+        data = load_json_file(mods_json)
+        if not data:
+            return []
+        mods = data.get("mods", data) if isinstance(data, dict) else data
+        return mods if isinstance(mods, list) else []
+    elif mods_jsonl.exists():
+        return load_jsonl_file(mods_jsonl)
+    return None
+
+
+def scan_html_names(html_dir: Path) -> Optional[List[str]]:
+    """List the *.html names in html_dir with one os.scandir; None if it doesn't exist."""
+    try:
+        with os.scandir(html_dir) as entries:
+            return [entry.name for entry in entries if entry.name.endswith(".html")]
+    except FileNotFoundError:
+        return None
+    except NotADirectoryError:
+        return []
+
+
+def lowered_page_contains(page, needle: str) -> bool:
+    """
+    Return whether needle occurs in the lowercased text of page (a bytes-like object).
+
+    ASCII needles are matched case-insensitively on the raw bytes, so the page
+    is never decoded or copied. A needle with uppercase letters can never
+    occur in lowercased text.
+
+    For valid UTF-8 pages this agrees with
+    needle in page.decode('utf-8', errors='ignore').lower(), except around
+    non-ASCII characters whose lowercase form is ASCII (KELVIN SIGN, U+0130).
+    Invalid bytes inside a word also differ: decoding drops them and joins
+    the pieces, while the byte match does not.
+    """
+    if needle != needle.lower():
+        return False
+    if needle.isascii():
+        return re.search(re.escape(needle.encode()), page, re.IGNORECASE) is not None
+    # Non-ASCII needles need Unicode case folding, so only these decode the page
+    return needle in bytes(page).decode('utf-8', errors='ignore').lower()
+
+
+def audit_pipeline_completeness(source_dir: Path, result: AuditResult, data: AuditData):
     """Check that all pipeline stages have output files."""
 
     # Stage 1: URL Discovery
@@ -197,86 +335,54 @@ def audit_pipeline_completeness(source_dir: Path, result: AuditResult):
         result.stats["url_file"] = str(url_file.name)
 
         if urls_json.exists():
-            data = load_json_file(urls_json)
-            if data:
-                urls = data.get("urls", []) if isinstance(data, dict) else data
+            url_data = load_json_file(urls_json)
+            if url_data:
+                urls = url_data.get("urls", []) if isinstance(url_data, dict) else url_data
                 result.stats["total_urls"] = len(urls)
         else:
-            urls = load_jsonl_file(urls_jsonl)
-            result.stats["total_urls"] = len(urls)
+            # Only counted, so stream it rather than holding every record
+            result.stats["total_urls"] = sum(1 for _ in iter_jsonl_file(urls_jsonl))
 
     # Stage 2: HTML Scraping
-    html_dir = source_dir / "html"
-    if not html_dir.exists():
+    if data.html_names is None:
         result.add_issue("critical", "completeness", "No html/ directory found")
     else:
-        html_files = list(html_dir.glob("*.html"))
-        result.stats["html_files"] = len(html_files)
+        result.stats["html_files"] = len(data.html_names)
 
-        if len(html_files) == 0:
+        if len(data.html_names) == 0:
             result.add_issue("critical", "completeness", "html/ directory is empty")
 
     # Stage 3: Build Extraction
-    builds_json = source_dir / "builds.json"
-    builds_jsonl = source_dir / "builds.jsonl"
-
-    if not builds_json.exists() and not builds_jsonl.exists():
+    if data.builds is None:
         result.add_issue("critical", "completeness", "No builds file found (builds.json or builds.jsonl)")
     else:
-        if builds_json.exists():
-            data = load_json_file(builds_json)
-            if data:
-                builds = data.get("builds", data) if isinstance(data, dict) else data
-                result.stats["total_builds"] = len(builds) if isinstance(builds, list) else 0
-        else:
-            builds = load_jsonl_file(builds_jsonl)
-            result.stats["total_builds"] = len(builds)
+        result.stats["total_builds"] = len(data.builds)
 
     # Stage 4: Mod Extraction (optional - mods may be in builds.json)
-    mods_json = source_dir / "mods.json"
-    mods_jsonl = source_dir / "mods.jsonl"
-
-    if mods_json.exists():
-        data = load_json_file(mods_json)
-        if data:
-            mods = data.get("mods", data) if isinstance(data, dict) else data
-            result.stats["total_mods_file"] = len(mods) if isinstance(mods, list) else 0
-    elif mods_jsonl.exists():
-        mods = load_jsonl_file(mods_jsonl)
-        result.stats["total_mods_file"] = len(mods)
+    if data.mods is not None:
+        result.stats["total_mods_file"] = len(data.mods)
 
 
-def audit_cross_reference_integrity(source_dir: Path, result: AuditResult):
+def audit_cross_reference_integrity(source_dir: Path, result: AuditResult, data: AuditData):
     """Verify HTML files match extracted builds."""
 
-    html_dir = source_dir / "html"
-    if not html_dir.exists():
+    if data.html_names is None:
         return
 
-    # Get HTML file build_ids
-    html_build_ids = set()
-    for html_file in html_dir.glob("*.html"):
-        # Extract build_id from filename (e.g., 1234567890.html)
+    # Get HTML file build_ids from filenames (e.g., 1234567890.html); the
+    # all-decimal stems are converted in one pass with no exception handling
+    stems = [name[:-5] for name in data.html_names]
+    html_build_ids = {int(stem) for stem in stems if stem.isdecimal()}
+    for stem in [stem for stem in stems if not stem.isdecimal()]:
+        # int() still accepts a few non-decimal forms, e.g. "-5" or "1_000"
         try:
-            build_id = int(html_file.stem)
-            html_build_ids.add(build_id)
+            html_build_ids.add(int(stem))
         except ValueError:
             # Filename might be a slug, not a build_id
             pass
 
     # Get extracted build_ids
-    builds = []
-    builds_json = source_dir / "builds.json"
-    builds_jsonl = source_dir / "builds.jsonl"
-
-    if builds_json.exists():
-        data = load_json_file(builds_json)
-        if data:
-            builds = data.get("builds", data) if isinstance(data, dict) else data
-            if not isinstance(builds, list):
-                builds = []
-    elif builds_jsonl.exists():
-        builds = load_jsonl_file(builds_jsonl)
+    builds = data.builds or []
 
     extracted_build_ids = set()
     for build in builds:
@@ -321,22 +427,10 @@ def audit_cross_reference_integrity(source_dir: Path, result: AuditResult):
         result.stats["extraction_rate_pct"] = round(extraction_rate, 1)
 
 
-def audit_data_quality(source_dir: Path, result: AuditResult):
+def audit_data_quality(source_dir: Path, result: AuditResult, data: AuditData):
     """Validate data quality of extracted builds."""
 
-    builds = []
-    builds_json = source_dir / "builds.json"
-    builds_jsonl = source_dir / "builds.jsonl"
-
-    if builds_json.exists():
-        data = load_json_file(builds_json)
-        if data:
-            builds = data.get("builds", data) if isinstance(data, dict) else data
-            if not isinstance(builds, list):
-                builds = []
-    elif builds_jsonl.exists():
-        builds = load_jsonl_file(builds_jsonl)
-
+    builds = data.builds
     if not builds:
         return
 
@@ -351,51 +445,67 @@ def audit_data_quality(source_dir: Path, result: AuditResult):
     unusual_makes = []
 
     seen_ids = set()
-    required_fields = ["build_id", "source_url", "year", "make", "model"]
+    makes = Counter()
+
+    # Locals for the per-build loop
+    min_year, max_year = MIN_VALID_YEAR, MAX_VALID_YEAR
+    required_fields = REQUIRED_BUILD_FIELDS
+    common_makes = COMMON_MAKES
+    valid_source_types = VALID_SOURCE_TYPES
+    valid_build_types = VALID_BUILD_TYPES
 
+    # One pass over the builds for every per-build check and the make tally
     for i, build in enumerate(builds):
-        # Required fields
-        for field in required_fields:
-            if field not in build or build[field] is None or build[field] == "":
-                missing_required[field] += 1
+        get = build.get
+
+        # Required fields (missing, None or "")
+        for name in required_fields:
+            value = get(name)
+            if value is None or value == "":
+                missing_required[name] += 1
 
         # Duplicate IDs
-        bid = build.get("build_id")
+        bid = get("build_id")
         if bid:
             if bid in seen_ids:
                 duplicate_ids.append(bid)
             seen_ids.add(bid)
 
         # Year validation
-        year = build.get("year")
+        year = get("year")
         if year:
             try:
                 year_int = int(str(year).strip())
-                if year_int < MIN_VALID_YEAR or year_int > MAX_VALID_YEAR:
+                if not min_year <= year_int <= max_year:
                     invalid_years.append({"index": i, "year": year})
             except (ValueError, TypeError):
                 invalid_years.append({"index": i, "year": year})
 
-        # Make validation
-        make = build.get("make", "")
-        if not make or str(make).strip() == "":
+        # Make validation; each make is normalized once, for the check and the tally
+        make = get("make")
+        if make:
+            make_key = str(make).lower().strip()
+            makes[make_key] += 1
+            if not make_key:
+                empty_makes += 1
+            elif len(unusual_makes) < 10 and make_key not in common_makes:
+                unusual_makes.append(make)
+        else:
             empty_makes += 1
-        elif str(make).lower().strip() not in COMMON_MAKES and len(unusual_makes) < 10:
-            unusual_makes.append(make)
 
         # Model validation
-        model = build.get("model", "")
-        if not model or str(model).strip() == "":
+        model = get("model")
+        if not model or not str(model).strip():
             empty_models += 1
 
         # Source type validation
-        source_type = build.get("source_type")
-        if source_type and source_type not in VALID_SOURCE_TYPES:
+        source_type = get("source_type")
+        if source_type and source_type not in valid_source_types:
             invalid_source_types.append(source_type)
 
         # Build type validation
-        build_type = build.get("build_type")
-        if build_type and build_type not in VALID_BUILD_TYPES:
+        build_type = get("build_type")
+        if build_type and build_type not in valid_build_types:
             invalid_build_types.append(build_type)
 
     # Report issues
@@ -459,43 +569,18 @@ def audit_data_quality(source_dir: Path, result: AuditResult):
     result.stats["unique_build_ids"] = len(seen_ids)
 
     # Make/Model stats
-    makes = Counter(str(b.get("make", "")).lower().strip() for b in builds if b.get("make"))
     result.stats["unique_makes"] = len(makes)
     result.stats["top_makes"] = dict(makes.most_common(5))
 
 
-def audit_modification_quality(source_dir: Path, result: AuditResult):
+def audit_modification_quality(source_dir: Path, result: AuditResult, data: AuditData):
     """Validate modification data quality."""
 
     # Collect all mods (from mods.json or embedded in builds)
-    all_mods = []
-
-    # From standalone mods file
-    mods_json = source_dir / "mods.json"
-    mods_jsonl = source_dir / "mods.jsonl"
-
-    if mods_json.exists():
-        data = load_json_file(mods_json)
-        if data:
-            mods = data.get("mods", data) if isinstance(data, dict) else data
-            if isinstance(mods, list):
-                all_mods.extend(mods)
-    elif mods_jsonl.exists():
-        all_mods.extend(load_jsonl_file(mods_jsonl))
+    all_mods = list(data.mods or [])
 
     # From builds
-    builds_json = source_dir / "builds.json"
-    builds_jsonl = source_dir / "builds.jsonl"
-    builds = []
-
-    if builds_json.exists():
-        data = load_json_file(builds_json)
-        if data:
-            builds = data.get("builds", data) if isinstance(data, dict) else data
-            if not isinstance(builds, list):
-                builds = []
-    elif builds_jsonl.exists():
-        builds = load_jsonl_file(builds_jsonl)
+    builds = data.builds or []
 
     builds_with_mods = 0
     for build in builds:
@@ -567,22 +652,10 @@ def audit_modification_quality(source_dir: Path, result: AuditResult):
         result.stats["avg_mods_per_build"] = round(avg_mods, 1)
 
 
-def audit_image_urls(source_dir: Path, result: AuditResult):
+def audit_image_urls(source_dir: Path, result: AuditResult, data: AuditData):
     """Validate image URLs in builds."""
 
-    builds = []
-    builds_json = source_dir / "builds.json"
-    builds_jsonl = source_dir / "builds.jsonl"
-
-    if builds_json.exists():
-        data = load_json_file(builds_json)
-        if data:
-            builds = data.get("builds", data) if isinstance(data, dict) else data
-            if not isinstance(builds, list):
-                builds = []
-    elif builds_jsonl.exists():
-        builds = load_jsonl_file(builds_jsonl)
-
+    builds = data.builds
     if not builds:
         return
 
@@ -590,13 +663,7 @@ def audit_image_urls(source_dir: Path, result: AuditResult):
     builds_with_images = 0
     invalid_urls = 0
     placeholder_images = 0
-
-    # Patterns for placeholder/broken images
-    placeholder_patterns = [
-        r'placeholder', r'no-image', r'noimage', r'default', r'missing',
-        r'blank\.', r'1x1\.', r'spacer', r'transparent'
-    ]
-    placeholder_re = re.compile('|'.join(placeholder_patterns), re.IGNORECASE)
+    absolute_url_match = ABSOLUTE_URL_RE.match
 
     for build in builds:
         images = build.get("gallery_images") or build.get("images") or []
@@ -613,13 +680,14 @@ def audit_image_urls(source_dir: Path, result: AuditResult):
             total_images += 1
 
             # URL format validation
-            parsed = urlparse(img)
-            if not parsed.scheme or not parsed.netloc:
-                invalid_urls += 1
-                continue
+            if not absolute_url_match(img):
+                parsed = urlparse(img)
+                if not parsed.scheme or not parsed.netloc:
+                    invalid_urls += 1
+                    continue
 
             # Placeholder detection
-            if placeholder_re.search(img):
+            if PLACEHOLDER_IMAGE_RE.search(img):
                 placeholder_images += 1
 
     result.stats["total_images"] = total_images
@@ -652,7 +720,7 @@ def audit_image_urls(source_dir: Path, result: AuditResult):
             )
 
 
-def audit_extraction_accuracy(source_dir: Path, result: AuditResult, sample_size: int = 5):
+def audit_extraction_accuracy(source_dir: Path, result: AuditResult, data: AuditData, sample_size: int = 5):
     """
     Sample HTML files and verify extraction accuracy.
 
@@ -660,24 +728,10 @@ def audit_extraction_accuracy(source_dir: Path, result: AuditResult, sample_size
     that extracted year/make/model actually appear in the source.
     """
 
-    html_dir = source_dir / "html"
-    if not html_dir.exists():
+    if data.html_names is None:
         return
 
-    # Load builds indexed by build_id
-    builds = []
-    builds_json = source_dir / "builds.json"
-    builds_jsonl = source_dir / "builds.jsonl"
-
-    if builds_json.exists():
-        data = load_json_file(builds_json)
-        if data:
-            builds = data.get("builds", data) if isinstance(data, dict) else data
-            if not isinstance(builds, list):
-                builds = []
-    elif builds_jsonl.exists():
-        builds = load_jsonl_file(builds_jsonl)
-
+    builds = data.builds
     if not builds:
         return
 
@@ -688,42 +742,48 @@ def audit_extraction_accuracy(source_dir: Path, result: AuditResult, sample_size
         if bid:
             builds_by_id[str(bid)] = build
 
-    # Sample HTML files that have corresponding builds
-    html_files = list(html_dir.glob("*.html"))
-    matched_files = [f for f in html_files if f.stem in builds_by_id]
-
-    if not matched_files:
+    # Sample HTML files that have corresponding builds; only the sample
+    # becomes Path objects
+    _, sample_names = reservoir_sample(
+        (name for name in data.html_names if name[:-5] in builds_by_id),
+        sample_size,
+    )
+    if not sample_names:
         return
 
-    # Random sample
-    sample_files = random.sample(matched_files, min(sample_size, len(matched_files)))
-
+    html_dir = source_dir / "html"
     accuracy_checks = []
 
-    for html_file in sample_files:
-        build = builds_by_id.get(html_file.stem)
+    for name in sample_names:
+        build = builds_by_id.get(name[:-5])
         if not build:
             continue
+        html_file = html_dir / name
 
-        try:
-            html_content = html_file.read_text(encoding='utf-8', errors='ignore').lower()
-        except Exception:
-            continue
-
-        # Check if year appears in HTML
         year = str(build.get("year", ""))
-        year_found = year and year in html_content
-
-        # Check if make appears in HTML
         make = str(build.get("make", "")).lower()
-        make_found = make and make in html_content
-
-        # Check if model appears in HTML
         model = str(build.get("model", "")).lower()
-        model_found = model and model in html_content
+
+        # Search the whole page in place through a read-only mapping
+        try:
+            with open(html_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    page = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    page = b""  # Empty files can't be mapped
+                try:
+                    # Check if year/make/model appear in HTML
+                    year_found = year and lowered_page_contains(page, year)
+                    make_found = make and lowered_page_contains(page, make)
+                    model_found = model and lowered_page_contains(page, model)
+                finally:
+                    if isinstance(page, mmap.mmap):
+                        page.close()
+        except Exception:
+            continue
 
         check = {
-            "build_id": html_file.stem,
+            "build_id": name[:-5],
             "year": {"value": year, "found": year_found},
             "make": {"value": make, "found": make_found},
             "model": {"value": model, "found": model_found},
@@ -830,25 +890,40 @@ def run_audit(
     print(f"🔍 DEEP CONTENT AUDIT: {source_dir.name}")
     print(f"{'='*60}\n")
 
+    # Parse builds/mods once for all the checks
+    data = AuditData.load(source_dir)
+
     # Run all audit checks
     print("Checking pipeline completeness...")
-    audit_pipeline_completeness(source_dir, result)
+    audit_pipeline_completeness(source_dir, result, data)
 
     print("Checking cross-reference integrity...")
-    audit_cross_reference_integrity(source_dir, result)
-
-    print("Validating data quality...")
-    audit_data_quality(source_dir, result)
-
-    print("Validating modifications...")
-    audit_modification_quality(source_dir, result)
-
-    print("Validating image URLs...")
-    audit_image_urls(source_dir, result)
-
+    audit_cross_reference_integrity(source_dir, result, data)
+
+    # These checks only read the shared data, so they run side by side (the
+    # HTML sampling's file reads overlap the validation). Each records into
+    # its own AuditResult, merged back in this order so the report doesn't
+    # depend on thread scheduling.
+    checks = [
+        ("Validating data quality...", audit_data_quality, ()),
+        ("Validating modifications...", audit_modification_quality, ()),
+        ("Validating image URLs...", audit_image_urls, ()),
+    ]
     if not quick and sample_html > 0:
-        print(f"Sampling {sample_html} HTML files for accuracy...")
-        audit_extraction_accuracy(source_dir, result, sample_html)
+        checks.append((f"Sampling {sample_html} HTML files for accuracy...", audit_extraction_accuracy, (sample_html,)))
+
+    partials = [
+        AuditResult(source_dir=source_dir, timestamp=result.timestamp, duration_seconds=0, passed=True)
+        for _ in checks
+    ]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = []
+        for (message, check, args), partial in zip(checks, partials):
+            print(message)
+            futures.append(executor.submit(check, source_dir, partial, data, *args))
+        for future, partial in zip(futures, partials):
+            future.result()
+            result.merge(partial)
 
     print("Calculating coverage metrics...")
     audit_coverage(source_dir, result)
@@ -947,7 +1022,8 @@ def main():
     )
 
     if args.json:
-        print(json.dumps(result.to_dict(), indent=2))
+        sys.stdout.flush()  # Progress lines first, then the JSON bytes
+        dump_indented(result.to_dict(issue_objects=True), sys.stdout.buffer, default=audit_json_default)
     else:
         print_result(result)
 
@@ -19,7 +19,10 @@ Usage:
 import hashlib
 import json
 import sys
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
+
+# Keeps the low 63 bits: x & _MASK63 == x % 2**63 for non-negative x
+_MASK63 = (1 << 63) - 1
 
 
 def url_to_build_id(url: str) -> int:
@@ -31,17 +34,31 @@ def url_to_build_id(url: str) -> int:
     Returns:
         A deterministic 63-bit signed integer ID
     """
-    # Trim and compute MD5
+    # Trim and compute MD5 (an ID, not a security use: allowed in FIPS mode)
     url_trimmed = url.strip()
-    md5_hash = hashlib.md5(url_trimmed.encode('utf-8')).digest()
-    
-    # Get lower 64 bits as unsigned integer (little-endian)
-    md5_lower = int.from_bytes(md5_hash[:8], byteorder='little', signed=False)
+    md5_hash = hashlib.md5(url_trimmed.encode('utf-8'), usedforsecurity=False).digest()
     
-    # Apply modulo 2^63 and convert to signed (DuckDB BIGINT compatible)
-    build_id = md5_lower % (1 << 63)
+    # Lower 64 bits as unsigned integer (little-endian), reduced modulo 2^63
+    # with a mask so it fits a signed BIGINT (DuckDB compatible)
+    return int.from_bytes(md5_hash[:8], byteorder='little') & _MASK63
+
+
+def iter_batch(urls: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    """Lazily generate build IDs for a stream of URLs.
     
-    return build_id
+    Args:
+        urls: Iterable of URLs (consumed one at a time)
+        
+    Yields:
+        (url, build_id) tuples
+    """
+    # url_to_build_id inlined with its callables bound to locals: for big
+    # batches the per-call overhead costs more than the hashing itself
+    md5 = hashlib.md5
+    from_bytes = int.from_bytes
+    mask = _MASK63
+    for url in urls:
+        yield url, from_bytes(md5(url.strip().encode('utf-8'), usedforsecurity=False).digest()[:8], 'little') & mask
 
 
 def generate_batch(urls: List[str]) -> List[Tuple[str, int]]:
@@ -53,7 +70,7 @@ def generate_batch(urls: List[str]) -> List[Tuple[str, int]]:
     Returns:
         List of (url, build_id) tuples
     """
-    return [(url, url_to_build_id(url)) for url in urls]
+    return list(iter_batch(urls))
 
 
 if __name__ == "__main__":
@@ -76,11 +93,18 @@ if __name__ == "__main__":
             print("Usage: python build_id_generator.py --batch <urls_file>")
             sys.exit(1)
         
+        # Stream the file through, writing output in large chunks rather
+        # than one print (and line-buffered flush) per URL
+        out = sys.stdout.buffer
+        lines = []
         with open(sys.argv[2], "r") as f:
-            urls = [line.strip() for line in f if line.strip()]
-        
-        for url, build_id in generate_batch(urls):
-            print(f"{build_id}\t{url}")
+            urls = (url for url in map(str.strip, f) if url)
+            for url, build_id in iter_batch(urls):
+                lines.append(f"{build_id}\t{url}\n")
+                if len(lines) == 8192:
+                    out.write("".join(lines).encode())
+                    lines.clear()
+        out.write("".join(lines).encode())
     
     else:
         # Single URL lookup
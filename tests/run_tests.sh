@@ -40,6 +40,10 @@ echo -e "${BLUE}-----------${NC}"
 echo ""run_test "$TEST_DIR/test_checkpoint_manager.py" || FAILED=$((FAILED + 1))
 run_test "$TEST_DIR/test_source_discovery.py" || FAILED=$((FAILED + 1))
 run_test "$TEST_DIR/test_parallel_processor.py" || FAILED=$((FAILED + 1))
+run_test "$TEST_DIR/test_aggressive_checkpoint.py" || FAILED=$((FAILED + 1))
+run_test "$TEST_DIR/test_audit_data.py" || FAILED=$((FAILED + 1))
+run_test "$TEST_DIR/test_sampling.py" || FAILED=$((FAILED + 1))
+run_test "$TEST_DIR/test_build_id_generator.py" || FAILED=$((FAILED + 1))
 
 # Integration tests
 echo -e "${BLUE}Integration Tests${NC}"
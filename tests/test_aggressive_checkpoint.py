@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the aggressive stealth scraper's checkpointing and page writer
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'tools'))
+
+from aggressive_stealth_scraper import (
+    CHECKPOINT_SAVE_EVERY,
+    AggressiveStealthConfig,
+    AggressiveStealthScraper,
+    SmartCheckpointManager,
+)
+
+
+class TestSmartCheckpointManager(unittest.TestCase):
+    """Test cases for SmartCheckpointManager class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.checkpoint_path = Path(self.temp_dir) / "aggressive_checkpoint.json"
+        self.journal_path = self.checkpoint_path.with_suffix(".jsonl")
+        self.db_path = self.checkpoint_path.with_suffix(".db")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_legacy(self, state, journal=None):
+        with open(self.checkpoint_path, 'w') as f:
+            json.dump(state, f)
+        if journal is not None:
+            with open(self.journal_path, 'w') as f:
+                for entry in journal:
+                    f.write(json.dumps(entry) + "\n")
+
+    def test_import_legacy_checkpoint(self):
+        """Test a legacy JSON checkpoint and its journal are imported."""
+        self.write_legacy(
+            {
+                "processed_urls": ["https://a.example/1", "https://a.example/2"],
+                "failed_urls": ["https://a.example/3"],
+                "blocked_urls": ["https://a.example/4"],
+                "daily_counts": {"2024-01-01": 2},
+                "rate_limited_count": 3,
+            },
+            journal=[
+                {"op": "processed", "url": "https://a.example/5", "day": "2024-01-01"},
+                {"op": "failed", "url": "https://a.example/6"},
+            ],
+        )
+
+        manager = SmartCheckpointManager(self.checkpoint_path)
+
+        self.assertTrue(manager.is_processed("https://a.example/1"))
+        self.assertTrue(manager.is_processed("https://a.example/5"))
+        self.assertFalse(manager.is_processed("https://a.example/3"))
+        stats = manager.stats
+        self.assertEqual(stats["processed"], 3)
+        self.assertEqual(stats["failed"], 2)
+        self.assertEqual(stats["blocked"], 1)
+        self.assertEqual(stats["rate_limited_total"], 3)
+        self.assertFalse(self.journal_path.exists())
+
+        # The legacy file is replaced by the dashboard status summary
+        with open(self.checkpoint_path) as f:
+            status = json.load(f)
+        self.assertEqual(status["processed"], 3)
+        self.assertEqual(status["daily_counts"], {"2024-01-01": 3})
+
+    def test_import_partial_legacy_checkpoint(self):
+        """Test a legacy checkpoint with only processed_urls is imported."""
+        self.write_legacy({"processed_urls": ["https://a.example/1"]})
+
+        manager = SmartCheckpointManager(self.checkpoint_path)
+
+        self.assertTrue(manager.is_processed("https://a.example/1"))
+        self.assertEqual(manager.stats["failed"], 0)
+        self.assertEqual(manager.stats["blocked"], 0)
+
+    def test_failed_import_is_retried(self):
+        """Test a failed import leaves no database, so the next start imports again."""
+        legacy = {"processed_urls": ["https://a.example/1"]}
+        self.write_legacy(legacy, journal=[{"op": "processed"}])
+
+        with self.assertRaises(KeyError):
+            SmartCheckpointManager(self.checkpoint_path)
+        self.assertFalse(self.db_path.exists())
+
+        self.write_legacy(legacy, journal=[])
+        manager = SmartCheckpointManager(self.checkpoint_path)
+        self.assertTrue(manager.is_processed("https://a.example/1"))
+
+    def test_resume_from_database(self):
+        """Test state saved to the database is picked up by a new manager."""
+        manager = SmartCheckpointManager(self.checkpoint_path)
+        manager.mark_processed("https://a.example/1")
+        manager.mark_blocked("https://a.example/2", 300)
+        manager.save()
+        manager.db.close()
+
+        resumed = SmartCheckpointManager(self.checkpoint_path)
+        self.assertTrue(resumed.is_processed("https://a.example/1"))
+        self.assertEqual(resumed.consecutive_blocks, 1)
+        self.assertEqual(resumed.counters["current_backoff"], 300)
+
+    def test_periodic_save(self):
+        """Test marks are committed and the status rewritten every CHECKPOINT_SAVE_EVERY updates."""
+        manager = SmartCheckpointManager(self.checkpoint_path)
+        for i in range(CHECKPOINT_SAVE_EVERY):
+            manager.mark_processed(f"https://a.example/{i}")
+
+        # Visible to another connection without an explicit save()
+        other = sqlite3.connect(self.db_path)
+        try:
+            count = other.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+        finally:
+            other.close()
+        self.assertEqual(count, CHECKPOINT_SAVE_EVERY)
+
+        with open(self.checkpoint_path) as f:
+            status = json.load(f)
+        self.assertEqual(status["processed"], CHECKPOINT_SAVE_EVERY)
+        self.assertEqual(status["today_count"], CHECKPOINT_SAVE_EVERY)
+
+
+class TestPageWriter(unittest.TestCase):
+    """Test cases for AggressiveStealthScraper._page_writer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.html_dir = self.temp_dir / "html"
+        self.html_dir.mkdir()
+        self.output_file = self.temp_dir / "scraped.jsonl"
+        self.checkpoint = SmartCheckpointManager(self.temp_dir / "aggressive_checkpoint.json")
+        self.scraper = AggressiveStealthScraper(AggressiveStealthConfig(self.temp_dir), self.checkpoint)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.checkpoint.db.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def result(self, n):
+        return {"build_id": n, "url": f"https://a.example/{n}", "html_bytes": b"<html>%d</html>" % n}
+
+    def write_pages(self, results):
+        async def run():
+            queue = asyncio.Queue()
+            for result in results:
+                queue.put_nowait(result)
+            queue.put_nowait(None)
+            with open(self.output_file, "ab") as out:
+                await self.scraper._page_writer(queue, out, self.html_dir, None)
+
+        asyncio.run(run())
+
+    def test_saved_page_is_marked_processed(self):
+        """Test a saved page is written and its URL marked processed."""
+        self.write_pages([self.result(1)])
+
+        self.assertTrue(self.checkpoint.is_processed("https://a.example/1"))
+        self.assertEqual((self.html_dir / "1.html").read_bytes(), b"<html>1</html>")
+        with open(self.output_file) as f:
+            meta = json.loads(f.readline())
+        self.assertEqual(meta, {"build_id": 1, "url": "https://a.example/1"})
+
+    def test_failed_save_leaves_url_unprocessed(self):
+        """Test a page whose save fails is not marked processed and later pages still are."""
+        with mock.patch.object(self.scraper, '_save_page', side_effect=[OSError("disk full"), None]):
+            with self.assertLogs('aggressive_stealth_scraper', 'ERROR'):
+                self.write_pages([self.result(1), self.result(2)])
+
+        self.assertFalse(self.checkpoint.is_processed("https://a.example/1"))
+        self.assertTrue(self.checkpoint.is_processed("https://a.example/2"))
+
+
+if __name__ == '__main__':
+    unittest.main()
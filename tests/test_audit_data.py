@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the data audit tool (scripts/tools/audit_data.py)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'tools'))
+
+import audit_data
+from audit_data import (
+    AuditCache,
+    BuildValidation,
+    DataAuditor,
+    HYPERSCAN_AVAILABLE,
+    SourceAudit,
+    find_error_types,
+    source_fingerprint,
+)
+
+
+# One document per kind of error page, plus a clean page
+ERROR_DOCUMENTS = [
+    (b'<html><title>403 Forbidden</title></html>', ['http_403']),
+    (b'<h1>Access Denied</h1>', ['access_denied']),
+    (b'Too Many Requests - you have been rate limited', ['rate_limited', 'rate_limited']),
+    (b'<p>This listing has been sold</p>', ['listing_removed']),
+    (b'Page Not Found', ['page_removed']),
+    (b'Please log in to view this build', ['login_required']),
+    (b'Members only. Coming soon. Under construction.', ['login_required', 'placeholder', 'placeholder']),
+    (b'<p>A clean build page about a 1969 Camaro</p>', []),
+]
+
+
+class TestBuildValidation(unittest.TestCase):
+    """Test cases for BuildValidation class."""
+
+    def test_completeness_score_empty(self):
+        """Test completeness score is 0 with no builds."""
+        self.assertEqual(BuildValidation().completeness_score, 0.0)
+
+    def test_completeness_score(self):
+        """Test completeness score for a known set of field counters."""
+        bv = BuildValidation(
+            total_builds=7,
+            with_build_id=7,
+            with_url=7,
+            with_make=6,
+            with_model=5,
+            with_year=4,
+            with_title=3,
+            with_story=2,
+            with_images=1,
+        )
+        self.assertEqual(bv.completeness_score, 73.9795918367347)
+
+    def test_completeness_score_tracks_counters(self):
+        """Test completeness score follows counter changes after it was computed."""
+        bv = BuildValidation(total_builds=2, with_build_id=1)
+        before = bv.completeness_score
+        bv.with_make = 2
+        self.assertGreater(bv.completeness_score, before)
+        bv.with_make = 0
+        self.assertEqual(bv.completeness_score, before)
+
+    def test_completeness_score_all_fields(self):
+        """Test completeness score is 100 when every build has every field."""
+        bv = BuildValidation(
+            total_builds=3,
+            with_build_id=3,
+            with_url=3,
+            with_make=3,
+            with_model=3,
+            with_year=3,
+            with_title=3,
+            with_story=3,
+            with_images=3,
+        )
+        self.assertAlmostEqual(bv.completeness_score, 100.0)
+
+
+class TestSourceAudit(unittest.TestCase):
+    """Test cases for SourceAudit class."""
+
+    def test_validation_results_not_shared(self):
+        """Test each source gets its own validation results."""
+        first = SourceAudit(name="a", path="/data/a")
+        second = SourceAudit(name="b", path="/data/b")
+        first.build_validation.total_builds = 5
+        first.mod_validation.categories["engine"] += 1
+        first.html_validation.error_pages = 1
+
+        self.assertEqual(second.build_validation.total_builds, 0)
+        self.assertEqual(len(second.mod_validation.categories), 0)
+        self.assertEqual(second.html_validation.error_pages, 0)
+
+
+class TestValidateBuildsDeep(unittest.TestCase):
+    """Test cases for DataAuditor._validate_builds_deep."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source_dir = self.temp_dir / "example_source"
+        self.source_dir.mkdir()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_samples_keep_first_offenders(self):
+        """Test the invalid year and unknown make samples list the first offenders, capped."""
+        builds = [
+            {"build_id": i, "year": str(1000 + i), "make": f"Nomake{i}"}
+            for i in range(20)
+        ]
+        (self.source_dir / "builds.json").write_text(json.dumps({"builds": builds}))
+        audit = SourceAudit(name="example_source", path=str(self.source_dir))
+
+        DataAuditor(self.temp_dir, deep=True)._validate_builds_deep(self.source_dir, audit)
+
+        bv = audit.build_validation
+        self.assertEqual(list(bv.invalid_years), ["1000", "1001", "1002", "1003", "1004"])
+        self.assertEqual(list(bv.unknown_makes), [f"Nomake{i}" for i in range(10)])
+
+
+class TestFindErrorTypes(unittest.TestCase):
+    """Test cases for find_error_types."""
+
+    def test_regex_fallback(self):
+        """Test the regex path (Hyperscan unavailable) finds each error type."""
+        with mock.patch.object(audit_data, 'hyperscan_db', return_value=None):
+            for content, expected in ERROR_DOCUMENTS:
+                self.assertEqual(find_error_types(content), expected, content)
+
+    @unittest.skipUnless(HYPERSCAN_AVAILABLE, "hyperscan not installed")
+    def test_hyperscan_matches_regex_fallback(self):
+        """Test Hyperscan and the regex fallback agree, with and without a limit."""
+        documents = [content for content, _ in ERROR_DOCUMENTS]
+        documents.append(b'x' * 40 + b' Access Denied, then cloudflare captcha')
+        for content in documents:
+            for limit in (None, 10, 45, 60):
+                with_hyperscan = find_error_types(content, limit)
+                with mock.patch.object(audit_data, 'hyperscan_db', return_value=None):
+                    without = find_error_types(content, limit)
+                self.assertEqual(with_hyperscan, without, (content, limit))
+
+
+class TestAuditCache(unittest.TestCase):
+    """Test cases for AuditCache and source_fingerprint."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source_dir = self.temp_dir / "data" / "example_source"
+        (self.source_dir / "html").mkdir(parents=True)
+        (self.source_dir / "builds.json").write_text('{"builds": []}')
+        (self.source_dir / "html" / "1.html").write_text("<html></html>")
+        self.cache_path = self.temp_dir / "audit_cache.json"
+        self.settings = [True, 1000]
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def put_audit(self, cache):
+        audit = SourceAudit(name="example_source", path=str(self.source_dir), html_files=1)
+        audit.build_validation.total_builds = 3
+        cache.put(self.source_dir, source_fingerprint(self.source_dir), self.settings, audit)
+
+    def test_hit_after_reload(self):
+        """Test an unchanged source is served from a saved cache."""
+        cache = AuditCache(self.cache_path)
+        self.put_audit(cache)
+        cache.save()
+
+        reloaded = AuditCache(self.cache_path)
+        audit = reloaded.get(self.source_dir, source_fingerprint(self.source_dir), self.settings)
+        self.assertIsNotNone(audit)
+        self.assertEqual(audit.html_files, 1)
+        self.assertEqual(audit.build_validation.total_builds, 3)
+
+    def test_miss_after_file_changes(self):
+        """Test changing, adding or removing a file invalidates the entry."""
+        cache = AuditCache(self.cache_path)
+        changes = [
+            lambda: (self.source_dir / "builds.json").write_text('{"builds": [{}]}'),
+            lambda: (self.source_dir / "html" / "2.html").write_text("<html></html>"),
+            lambda: (self.source_dir / "html" / "1.html").unlink(),
+        ]
+        for change in changes:
+            self.put_audit(cache)
+            change()
+            fingerprint = source_fingerprint(self.source_dir)
+            self.assertIsNone(cache.get(self.source_dir, fingerprint, self.settings))
+
+    def test_miss_after_settings_change(self):
+        """Test an entry made with other audit settings is not reused."""
+        cache = AuditCache(self.cache_path)
+        self.put_audit(cache)
+        fingerprint = source_fingerprint(self.source_dir)
+        self.assertIsNotNone(cache.get(self.source_dir, fingerprint, self.settings))
+        self.assertIsNone(cache.get(self.source_dir, fingerprint, [True, 50]))
+
+    def test_unreadable_cache_file(self):
+        """Test a corrupt cache file starts an empty cache."""
+        self.cache_path.write_text("{not json")
+        cache = AuditCache(self.cache_path)
+        self.assertEqual(cache.entries, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
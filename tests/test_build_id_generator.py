@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the build ID generator (scripts/tools/build_id_generator.py)
+"""
+
+import hashlib
+import os
+import unittest
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'tools'))
+
+from build_id_generator import generate_batch, iter_batch, url_to_build_id
+
+
+URLS = [
+    "https://example.com/build/1",
+    "  https://example.com/build/1\n",
+    "https://example.com/bygg/ø",
+    "",
+    "https://example.com/build/2?page=3#gallery",
+]
+
+
+class TestBuildIdGenerator(unittest.TestCase):
+    """Test cases for the build ID helpers."""
+
+    def test_known_ids(self):
+        """Test IDs stay pinned to their known values (DuckDB compatible)."""
+        self.assertEqual(url_to_build_id("https://example.com/build/1"), 6997775978816623431)
+        self.assertEqual(url_to_build_id("https://example.com/bygg/ø"), 1473437708849085125)
+
+    def test_matches_modulo_definition(self):
+        """Test the 63-bit mask gives the same IDs as reducing modulo 2^63."""
+        for url in URLS:
+            md5 = hashlib.md5(url.strip().encode('utf-8')).digest()
+            expected = int.from_bytes(md5[:8], byteorder='little') % (1 << 63)
+            self.assertEqual(url_to_build_id(url), expected, url)
+
+    def test_surrounding_whitespace_ignored(self):
+        """Test URLs are trimmed before hashing."""
+        self.assertEqual(url_to_build_id(URLS[0]), url_to_build_id(URLS[1]))
+
+    def test_iter_batch_matches_single(self):
+        """Test iter_batch yields the same IDs as url_to_build_id, lazily."""
+        batch = iter_batch(iter(URLS))
+        self.assertEqual(next(batch), (URLS[0], url_to_build_id(URLS[0])))
+        self.assertEqual(list(batch), [(url, url_to_build_id(url)) for url in URLS[1:]])
+
+    def test_generate_batch_matches_single(self):
+        """Test generate_batch returns (url, build_id) pairs in input order."""
+        self.assertEqual(generate_batch(URLS), [(url, url_to_build_id(url)) for url in URLS])
+
+
+if __name__ == '__main__':
+    unittest.main()
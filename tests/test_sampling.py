@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared reservoir sampler (scripts/tools/_sampling.py)
+"""
+
+import os
+import random
+import unittest
+from collections import Counter
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts', 'tools'))
+
+from _sampling import reservoir_sample
+
+
+class TestReservoirSample(unittest.TestCase):
+    """Test cases for reservoir_sample."""
+
+    def setUp(self):
+        """Seed the generator so sampling runs are repeatable."""
+        random.seed(1234)
+
+    def test_sample_size_and_total(self):
+        """Test the sample has min(k, n) distinct items and the total counts every item."""
+        for n in (0, 1, 4, 5, 6, 100, 10000):
+            for k in (1, 5, 50):
+                total, sample = reservoir_sample(iter(range(n)), k)
+                self.assertEqual(total, n)
+                self.assertEqual(len(sample), min(k, n))
+                self.assertEqual(len(set(sample)), len(sample))
+                self.assertTrue(set(sample) <= set(range(n)))
+
+    def test_short_input_returned_whole(self):
+        """Test k or fewer items are all returned, in order."""
+        total, sample = reservoir_sample(["a", "b", "c"], 5)
+        self.assertEqual(total, 3)
+        self.assertEqual(sample, ["a", "b", "c"])
+
+    def test_zero_k(self):
+        """Test k=0 still counts the items but samples none."""
+        total, sample = reservoir_sample(range(10), 0)
+        self.assertEqual(total, 10)
+        self.assertEqual(sample, [])
+
+    def test_coverage(self):
+        """Test every item gets sampled, at roughly the uniform rate."""
+        n, k, trials = 50, 5, 4000
+        hits = Counter()
+        for _ in range(trials):
+            _, sample = reservoir_sample(range(n), k)
+            hits.update(sample)
+
+        self.assertEqual(set(hits), set(range(n)))
+        expected = trials * k / n
+        for item in range(n):
+            self.assertGreater(hits[item], expected * 0.75, item)
+            self.assertLess(hits[item], expected * 1.25, item)
+
+
+if __name__ == '__main__':
+    unittest.main()